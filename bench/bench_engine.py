@@ -0,0 +1,92 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import ENGINES, Interpreter
+
+
+def ornek_scaled(n: int) -> str:
+    return f"""
+fonksiyon kare(a):
+    don a * a
+bitti
+
+x = 0
+toplam = 0
+
+dongu x < {n}:
+    toplam = toplam + kare(x % 100)
+    eger toplam > 1000000:
+        toplam = toplam - 1000000
+    bitti
+    x = x + 1
+bitti
+
+eger toplam > 10:
+    yazdir("toplam", toplam)
+degilse:
+    yazdir("kucuk", toplam)
+bitti
+"""
+
+
+def nested_loops(n: int) -> str:
+    return f"""
+i = 0
+s = 0
+dongu i < {n}:
+    j = 0
+    dongu j < 100:
+        s = s + i * j - (j % 7)
+        j = j + 1
+    bitti
+    i = i + 1
+bitti
+yazdir(s)
+"""
+
+
+def run_once(source: str, engine: str) -> tuple:
+    buf = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(buf):
+        Interpreter(engine=engine).run(source)
+    return time.perf_counter() - start, buf.getvalue()
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Yurutme motorlarini karsilastir")
+    p.add_argument("-n", type=int, default=200000, help="ornek.tay dongu sayisi")
+    p.add_argument("--tekrar", type=int, default=3)
+    args = p.parse_args()
+
+    workloads = {
+        "ornek_scaled": ornek_scaled(args.n),
+        "nested_loops": nested_loops(args.n // 100),
+    }
+    for wname, source in workloads.items():
+        results = {}
+        outputs = set()
+        for engine in ENGINES:
+            best = None
+            for _ in range(args.tekrar):
+                t, out = run_once(source, engine)
+                outputs.add(out)
+                best = t if best is None else min(best, t)
+            results[engine] = best
+        base = results["tree"]
+        for engine, t in results.items():
+            print(f"{wname:14} {engine:8} {t * 1000:9.1f} ms  x{base / t:5.2f}")
+        if len(outputs) != 1:
+            print(f"{wname}: motor ciktilari farkli!")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+import argparse
+import os
+import sys
+import time
+from typing import Any, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import Lexer, Parser, Token
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Eski karakter-karakter lexer; karsilastirma ve dogrulama icin.
+class LegacyLexer:
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.pos = 0
+        self.line = 1
+        self.col = 1
+        self.tokens: List[Token] = []
+
+    def _peek(self) -> str:
+        if self.pos >= len(self.source):
+            return "\0"
+        return self.source[self.pos]
+
+    def _advance(self) -> str:
+        ch = self._peek()
+        self.pos += 1
+        if ch == "\n":
+            self.line += 1
+            self.col = 1
+        else:
+            self.col += 1
+        return ch
+
+    def _add(self, type_: str, value: Any, line: int, col: int) -> None:
+        self.tokens.append(Token(type_, value, line, col))
+
+    def lex(self) -> List[Token]:
+        while self.pos < len(self.source):
+            ch = self._peek()
+            if ch in " \t\r":
+                self._advance()
+                continue
+            if ch == "#":
+                while self._peek() not in "\n\0":
+                    self._advance()
+                continue
+            if ch == "\n":
+                line, col = self.line, self.col
+                self._advance()
+                self._add("NEWLINE", "\n", line, col)
+                continue
+            if ch.isdigit():
+                line, col = self.line, self.col
+                num = ""
+                while self._peek().isdigit():
+                    num += self._advance()
+                if self._peek() == ".":
+                    num += self._advance()
+                    while self._peek().isdigit():
+                        num += self._advance()
+                    self._add("NUMBER", float(num), line, col)
+                else:
+                    self._add("NUMBER", int(num), line, col)
+                continue
+            if ch == '"':
+                line, col = self.line, self.col
+                self._advance()
+                s = ""
+                while self._peek() not in "\0\n\"":
+                    s += self._advance()
+                if self._peek() != '"':
+                    raise SyntaxError(f"String kapanmadı (satır {line})")
+                self._advance()
+                self._add("STRING", s, line, col)
+                continue
+            if ch.isalpha() or ch == "_":
+                line, col = self.line, self.col
+                ident = ""
+                while self._peek().isalnum() or self._peek() == "_" or self._peek() in "ğüşıöçĞÜŞİÖÇ":
+                    ident += self._advance()
+                self._add("IDENT", ident, line, col)
+                continue
+            line, col = self.line, self.col
+            two = self.source[self.pos:self.pos + 2]
+            if two in ("==", "!=", "<=", ">="):
+                self.pos += 2
+                self.col += 2
+                self._add("OP", two, line, col)
+                continue
+            if ch in "+-*/%=()<>:,[]":
+                self._advance()
+                self._add("OP", ch, line, col)
+                continue
+            raise SyntaxError(f"Bilinmeyen karakter: {ch} (satır {line})")
+
+        self._add("EOF", None, self.line, self.col)
+        return self.tokens
+
+
+def generate_source(target_mb: float) -> str:
+    with open(os.path.join(ROOT, "selfhost", "transpiler_v0.tay"), "r", encoding="utf-8-sig") as f:
+        base = f.read()
+    long_str = "x" * 20000
+    chunk = base + f'\nuzun = "{long_str}"\n'
+    repeat = max(1, int(target_mb * 1024 * 1024 / len(chunk)))
+    return chunk * repeat
+
+
+def timed(fn) -> tuple:
+    start = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - start, out
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Lexer mikro benchmark")
+    p.add_argument("--mb", type=float, default=4.0, help="Uretilecek kaynak boyutu (MB)")
+    p.add_argument("--eski", action="store_true", help="Eski lexer ile de olc")
+    args = p.parse_args()
+
+    src = generate_source(args.mb)
+    size_mb = len(src.encode("utf-8")) / (1024 * 1024)
+    print(f"kaynak: {size_mb:.2f} MB, {src.count(chr(10))} satir")
+
+    t_new, tokens = timed(lambda: Lexer(src).lex())
+    print(f"yeni lexer      {t_new * 1000:9.1f} ms  {len(tokens) / t_new:12.0f} token/s  {size_mb / t_new:7.2f} MB/s")
+
+    t_parse, _ = timed(lambda: Parser(Lexer(src).iter_tokens()).parse())
+    print(f"akisli parse    {t_parse * 1000:9.1f} ms")
+
+    if args.eski:
+        t_old, old_tokens = timed(lambda: LegacyLexer(src).lex())
+        print(f"eski lexer      {t_old * 1000:9.1f} ms  {len(old_tokens) / t_old:12.0f} token/s  x{t_old / t_new:.1f}")
+        if old_tokens != tokens:
+            print("token akislari farkli!")
+            return 1
+        print("token akislari ayni")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+import argparse
+import dataclasses
+import gc
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from taylan.core.interpreter import BinOp, Lexer, Node, Number, Token, Var, parse_source
+
+
+def generate_source(target_mb: float) -> str:
+    with open(os.path.join(ROOT, "selfhost", "transpiler_v0.tay"), "r", encoding="utf-8-sig") as f:
+        base = f.read()
+    repeat = max(1, int(target_mb * 1024 * 1024 / len(base)))
+    return base * repeat
+
+
+def retained(fn: Callable[[], Any]) -> Tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    out = fn()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return out, after - before
+
+
+def count_nodes(node: Any) -> int:
+    if isinstance(node, list):
+        return sum(count_nodes(n) for n in node)
+    if not isinstance(node, Node):
+        return 0
+    return 1 + sum(count_nodes(getattr(node, f.name)) for f in dataclasses.fields(node))
+
+
+def instance_size(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Token ve AST dugumu basina bellek")
+    p.add_argument("--mb", type=float, default=2.0, help="Uretilecek kaynak boyutu (MB)")
+    args = p.parse_args()
+
+    src = generate_source(args.mb)
+    print(f"kaynak: {len(src) / (1024 * 1024):.2f} MB, {src.count(chr(10))} satir")
+    print(f"tek nesne: Token {instance_size(Token('IDENT', 'x', 1, 1))} B, "
+          f"BinOp {instance_size(BinOp(Var('x'), '+', Number(1)))} B")
+
+    tokens, size = retained(lambda: Lexer(src).lex())
+    print(f"token listesi   {len(tokens):9} token  {size / len(tokens):7.1f} B/token  {size / 1e6:8.1f} MB")
+    del tokens
+
+    if hasattr(Lexer, "lex_compact"):
+        tokens, size = retained(lambda: Lexer(src).lex_compact())
+        print(f"token dizileri  {len(tokens):9} token  {size / len(tokens):7.1f} B/token  {size / 1e6:8.1f} MB")
+        del tokens
+
+    program, size = retained(lambda: parse_source(src))
+    nodes = count_nodes(program)
+    print(f"AST             {nodes:9} dugum  {size / nodes:7.1f} B/dugum  {size / 1e6:8.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
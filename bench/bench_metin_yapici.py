@@ -0,0 +1,84 @@
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import ENGINES, Interpreter
+
+# Her satir ayni uzunlukta olsun diye sira numarasi sabit genislikte yazilir.
+SATIR = 'metin_birlesik(metin_birlesik("satir ", metin(1000000 + i)), ": deger=42 durum=tamam aciklama=ornek")'
+
+YAPICI = f"""
+dahil "tcore"
+y = metin_yapici_olustur()
+icin i = 0, satir_sayisi:
+    metin_yapici_satir_ekle(y, {SATIR})
+bitti
+metin_yapici_dosyaya_yaz(y, cikti)
+"""
+
+BIRLESIK = f"""
+dahil "tcore"
+rapor = ""
+icin i = 0, satir_sayisi:
+    rapor = metin_birlesik(rapor, metin_birlesik({SATIR}, satir_sonu()))
+bitti
+dosya_yaz(cikti, rapor)
+"""
+
+LINE_BYTES = len("satir 1000000: deger=42 durum=tamam aciklama=ornek\n")
+
+
+def run_report(source: str, lines: int, out_path: str, engine: str) -> Tuple[float, int]:
+    interp = Interpreter(engine=engine)
+    interp.globals.update({"satir_sayisi": lines, "cikti": out_path})
+    start = time.perf_counter()
+    interp.run(source)
+    elapsed = time.perf_counter() - start
+    return elapsed, os.path.getsize(out_path)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="metin_yapici ile metin_birlesik zincirini karsilastir")
+    p.add_argument("--mb", type=float, default=50.0, help="metin_yapici ile uretilecek rapor boyutu")
+    p.add_argument(
+        "--birlesik-mb",
+        type=float,
+        default=2.0,
+        help="metin_birlesik zinciri icin en buyuk boyut (kare zamanli; daha buyugu tahmin edilir)",
+    )
+    p.add_argument("--engine", choices=ENGINES, default="tree")
+    args = p.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="taylan-metin-")
+    try:
+        out_path = os.path.join(work_dir, "rapor.txt")
+        print(f"{'yontem':16} {'MB':>8} {'sure s':>10} {'MB/s':>8}")
+        sizes = [args.birlesik_mb / 4, args.birlesik_mb / 2, args.birlesik_mb]
+        naive = []
+        for mb in sizes:
+            lines = int(mb * 1024 * 1024 / LINE_BYTES)
+            t, size = run_report(BIRLESIK, lines, out_path, args.engine)
+            naive.append((size, t))
+            print(f"{'metin_birlesik':16} {size / 1048576:8.2f} {t:10.2f} {size / 1048576 / t:8.2f}")
+        for mb in sizes + [args.mb]:
+            lines = int(mb * 1024 * 1024 / LINE_BYTES)
+            t, size = run_report(YAPICI, lines, out_path, args.engine)
+            print(f"{'metin_yapici':16} {size / 1048576:8.2f} {t:10.2f} {size / 1048576 / t:8.2f}")
+
+        # Zincir her eklemede o ana kadarki metni kopyalar: sure ~ boyut^2.
+        size, t = naive[-1]
+        target = args.mb * 1024 * 1024
+        print(f"\nmetin_birlesik {args.mb:.0f} MB tahmini (kare olcekleme): {t * (target / size) ** 2:,.0f} s")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
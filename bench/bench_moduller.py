@@ -0,0 +1,92 @@
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.cache import clear_cache, load_program
+from taylan.core.interpreter import ENGINES, Interpreter
+
+
+def function_source(i: int) -> str:
+    return (
+        f"fonksiyon f{i}(x):\n"
+        f"    t = 0\n"
+        f"    icin j = 0, x:\n"
+        f"        t = t + j * {i % 7 + 1}\n"
+        f"    bitti\n"
+        f"    don t\n"
+        f"bitti\n\n"
+    )
+
+
+def write_project(root: str, functions: int, modules: int) -> Dict[str, str]:
+    per_module = -(-functions // modules)
+    calls = "".join(f"toplam = toplam + f{i}(3)\n" for i in range(0, functions, max(1, functions // 50)))
+    # Ayni fonksiyonlar: tek dosyada ya da `modules` dosyaya bolunmus halde.
+    single = os.path.join(root, "tek")
+    split = os.path.join(root, "moduler")
+    os.makedirs(single)
+    os.makedirs(split)
+    with open(os.path.join(single, "ana.tay"), "w", encoding="utf-8") as f:
+        f.write("".join(function_source(i) for i in range(functions)))
+        f.write("toplam = 0\n" + calls)
+    imports = []
+    for m in range(modules):
+        with open(os.path.join(split, f"modul{m}.tay"), "w", encoding="utf-8") as f:
+            f.write("".join(function_source(i) for i in range(m * per_module, min(functions, (m + 1) * per_module))))
+        imports.append(f'dahil "modul{m}"\n')
+    with open(os.path.join(split, "ana.tay"), "w", encoding="utf-8") as f:
+        f.write("".join(imports) + "toplam = 0\n" + calls)
+    return {"tek dosya": single, f"{modules} modul": split}
+
+
+def load_ms(folder: str, engine: str, use_cache: bool) -> float:
+    path = os.path.join(folder, "ana.tay")
+    start = time.perf_counter()
+    with open(path, "r", encoding="utf-8-sig") as f:
+        src = f.read()
+    program = load_program(path, src, use_cache=use_cache)
+    interp = Interpreter(base_dir=folder, engine=engine, use_cache=use_cache)
+    interp.run_program(program)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Tek dosya ile modullere bolunmus projenin yukleme suresi")
+    p.add_argument("--fonksiyon", type=int, default=2000)
+    p.add_argument("--modul", type=int, default=20)
+    p.add_argument("--tekrar", type=int, default=5)
+    p.add_argument("--engine", choices=ENGINES, default="tree")
+    args = p.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="taylan-modul-")
+    try:
+        projects = write_project(work_dir, args.fonksiyon, args.modul)
+        print(f"{args.fonksiyon} fonksiyon, motor: {args.engine} (medyan ms)")
+        print(f"{'proje':12} {'onbelleksiz':>12} {'soguk onbellek':>15} {'sicak onbellek':>15}")
+        for label, folder in projects.items():
+            plain: List[float] = []
+            cold: List[float] = []
+            warm: List[float] = []
+            for _ in range(args.tekrar):
+                plain.append(load_ms(folder, args.engine, use_cache=False))
+                clear_cache(folder)
+                cold.append(load_ms(folder, args.engine, use_cache=True))
+                warm.append(load_ms(folder, args.engine, use_cache=True))
+            print(
+                f"{label:12} {statistics.median(plain):12.1f} {statistics.median(cold):15.1f}"
+                f" {statistics.median(warm):15.1f}"
+            )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
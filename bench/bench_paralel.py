@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import ENGINES, Interpreter
+
+# Her kayit icin ayni CPU agirlikli fonksiyon; kayitlar birbirinden bagimsiz.
+PROGRAM = """
+dahil "tcore"
+dahil "tparallel"
+
+fonksiyon isle(x):
+    t = 0
+    icin i = 0, adim:
+        t = t + (x * i) % 7
+    bitti
+    don t
+bitti
+
+kayitlar = dizi_olustur()
+icin i = 0, kayit_sayisi:
+    dizi_ekle(kayitlar, i)
+bitti
+"""
+
+SERI = """
+sonuc = dizi_olustur()
+icin i = 0, kayit_sayisi:
+    dizi_ekle(sonuc, isle(dizi_getir(kayitlar, i)))
+bitti
+"""
+
+PARALEL = """
+sonuc = paralel_esle("isle", kayitlar, isci)
+"""
+
+
+def timed(interp: Interpreter, source: str) -> Tuple[float, List[int]]:
+    start = time.perf_counter()
+    interp.run(source)
+    return time.perf_counter() - start, interp.globals["sonuc"]
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="paralel_esle ile seri dongu karsilastirmasi")
+    p.add_argument("--kayit", type=int, default=20000)
+    p.add_argument("--adim", type=int, default=200, help="Kayit basina dongu adimi (is yuku)")
+    p.add_argument("--isci", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    p.add_argument("--engine", choices=ENGINES, default="closure")
+    args = p.parse_args()
+
+    interp = Interpreter(engine=args.engine)
+    interp.globals.update({"kayit_sayisi": args.kayit, "adim": args.adim})
+    interp.run(PROGRAM)
+    serial, expected = timed(interp, SERI)
+    print(f"cpu: {os.cpu_count()}  kayit: {args.kayit}  adim: {args.adim}  motor: {args.engine}")
+    print(f"{'yontem':14} {'sure s':>8} {'hizlanma':>9}")
+    print(f"{'seri':14} {serial:8.2f} {1.0:9.2f}")
+    for workers in sorted(set(args.isci)):
+        interp.globals["isci"] = workers
+        # Ilk cagri havuzu ve iscilerdeki yorumlayicilari kurar; ikincisi yeniden kullanimi olcer.
+        first, out = timed(interp, PARALEL)
+        again, _ = timed(interp, PARALEL)
+        assert out == expected
+        print(f"{f'{workers} isci (ilk)':14} {first:8.2f} {serial / first:9.2f}")
+        print(f"{f'{workers} isci':14} {again:8.2f} {serial / again:9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,53 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import ENGINES, Interpreter
+
+
+def fib_source(global_count: int) -> str:
+    lines = [f"g{i} = {i}" for i in range(global_count)]
+    lines.append(
+        """
+fonksiyon fib(n):
+    eger n < 2:
+        don n
+    bitti
+    don fib(n - 1) + fib(n - 2)
+bitti
+"""
+    )
+    return "\n".join(lines) + "\n"
+
+
+def run_once(source: str, engine: str, n: int) -> float:
+    interp = Interpreter(engine=engine)
+    with contextlib.redirect_stdout(io.StringIO()):
+        interp.run(source)
+    start = time.perf_counter()
+    interp.call_function("fib", [n])
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Global sayisina gore fonksiyon cagrisi maliyeti")
+    p.add_argument("-n", type=int, default=20, help="fib(n)")
+    p.add_argument("--globals", type=int, nargs="*", default=[0, 10, 1000, 10000])
+    args = p.parse_args()
+
+    print(f"fib({args.n}) cagrisi, motor basina sure (ms)")
+    print(f"{'global':>8} " + " ".join(f"{e:>9}" for e in ENGINES))
+    for count in args.globals:
+        source = fib_source(count)
+        times = [run_once(source, e, args.n) for e in ENGINES]
+        print(f"{count:8} " + " ".join(f"{t * 1000:9.1f}" for t in times))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
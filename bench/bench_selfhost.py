@@ -0,0 +1,40 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from taylan.core.interpreter import ENGINES, Interpreter
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Selfhost transpiler ile ornek derleme suresi")
+    p.add_argument("--girdi", default=os.path.join(ROOT, "selfhost", "sample_blocks.tay"))
+    p.add_argument("--tekrar", type=int, default=20, help="Motor basina derleme sayisi")
+    p.add_argument("--engine", nargs="*", default=list(ENGINES), choices=ENGINES)
+    args = p.parse_args()
+
+    with open(os.path.join(ROOT, "selfhost", "transpiler_v0.tay"), "r", encoding="utf-8-sig") as f:
+        transpiler_src = f.read()
+
+    out_path = os.path.join(tempfile.mkdtemp(), "cikti.py")
+    print(f"{os.path.basename(args.girdi)} x{args.tekrar}")
+    for engine in args.engine:
+        interp = Interpreter(base_dir=ROOT, engine=engine)
+        with contextlib.redirect_stdout(io.StringIO()):
+            interp.run(transpiler_src)
+        start = time.perf_counter()
+        for _ in range(args.tekrar):
+            interp.call_function("selfhost_derle", [args.girdi, out_path])
+        elapsed = time.perf_counter() - start
+        print(f"{engine:8} {elapsed * 1000:9.1f} ms  ({elapsed * 1000 / args.tekrar:.2f} ms/derleme)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import ENGINES, Interpreter
+
+# Sozluk oncesi kalip: anahtarlar ve degerler iki paralel dizide, arama dogrusal tarama.
+DIZI = """
+dahil "tcore"
+
+fonksiyon bul(anahtarlar, degerler, k):
+    icin i = 0, dizi_uzunluk(anahtarlar):
+        eger dizi_getir(anahtarlar, i) == k:
+            don dizi_getir(degerler, i)
+        bitti
+    bitti
+    don ""
+bitti
+
+anahtarlar = dizi_olustur()
+degerler = dizi_olustur()
+icin i = 0, boyut:
+    dizi_ekle(anahtarlar, metin_birlesik("k", metin(i)))
+    dizi_ekle(degerler, i)
+bitti
+aranan = dizi_olustur()
+icin j = 0, arama:
+    dizi_ekle(aranan, metin_birlesik("k", metin((j * 7919) % boyut)))
+bitti
+baslangic_ms = saat_ms()
+toplam = 0
+icin j = 0, arama:
+    toplam = toplam + bul(anahtarlar, degerler, dizi_getir(aranan, j))
+bitti
+sure_ms = saat_ms() - baslangic_ms
+"""
+
+SOZLUK = """
+dahil "tcore"
+
+s = sozluk_olustur()
+icin i = 0, boyut:
+    sozluk_yaz(s, metin_birlesik("k", metin(i)), i)
+bitti
+aranan = dizi_olustur()
+icin j = 0, arama:
+    dizi_ekle(aranan, metin_birlesik("k", metin((j * 7919) % boyut)))
+bitti
+baslangic_ms = saat_ms()
+toplam = 0
+icin j = 0, arama:
+    toplam = toplam + sozluk_getir(s, dizi_getir(aranan, j), 0)
+bitti
+sure_ms = saat_ms() - baslangic_ms
+"""
+
+
+def lookup_us(source: str, size: int, lookups: int, engine: str) -> float:
+    interp = Interpreter(engine=engine)
+    # Yalnizca arama dongusu olculur; kurulum ve anahtar uretimi haric.
+    interp.builtins["saat_ms"] = lambda: time.perf_counter() * 1000
+    interp.globals.update({"boyut": size, "arama": lookups})
+    interp.run(source)
+    return interp.globals["sure_ms"] * 1000 / lookups
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="sozluk aramasi ile dizide dogrusal taramayi karsilastir")
+    p.add_argument("--boyut", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    p.add_argument("--arama", type=int, default=500)
+    p.add_argument("--engine", choices=ENGINES, default="tree")
+    args = p.parse_args()
+
+    print(f"{'boyut':>8} {'dizi us/arama':>15} {'sozluk us/arama':>16}")
+    for size in args.boyut:
+        scan = lookup_us(DIZI, size, args.arama, args.engine)
+        hashed = lookup_us(SOZLUK, size, args.arama, args.engine)
+        print(f"{size:8} {scan:15.2f} {hashed:16.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _wall_ms(cmd: List[str], runs: int) -> List[float]:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def _import_times(cmd: List[str]) -> Tuple[List[Tuple[int, int, str]], int]:
+    # -X importtime satirlari: "import time: self | cumulative | paket"
+    proc = subprocess.run(
+        [cmd[0], "-X", "importtime"] + cmd[1:],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    top_level = sum(c for _, c, name in rows if not name.startswith(" " * 2))
+    return rows, top_level
+
+
+def _summary(times: List[float]) -> str:
+    return f"ort {statistics.mean(times):7.1f} ms  medyan {statistics.median(times):7.1f} ms  en az {min(times):7.1f} ms"
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="`taylan calistir` soguk baslangic suresi")
+    p.add_argument("--tekrar", type=int, default=10)
+    p.add_argument("--ilk", type=int, default=15, help="Gosterilecek en pahali import sayisi")
+    args = p.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    script = os.path.join(work_dir, "merhaba.tay")
+    with open(script, "w", encoding="utf-8") as f:
+        f.write('yazdir("merhaba")\n')
+    try:
+        commands: Dict[str, List[str]] = {
+            "python -c pass": [sys.executable, "-c", "pass"],
+            "calistir": [sys.executable, "-m", "taylan.cli", "calistir", "--no-cache", script],
+            "calistir (onbellek)": [sys.executable, "-m", "taylan.cli", "calistir", script],
+        }
+        # Onbellek dosyasini olustur.
+        subprocess.run(commands["calistir (onbellek)"], cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        for label, cmd in commands.items():
+            print(f"{label:22} {_summary(_wall_ms(cmd, args.tekrar))}")
+
+        rows, total_us = _import_times(commands["calistir (onbellek)"])
+        print()
+        print(f"-X importtime, toplam {total_us / 1000:.1f} ms; kumulatif sureye gore:")
+        for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[: args.ilk]:
+            print(f"  {cumulative_us / 1000:7.2f} ms  (oz {self_us / 1000:6.2f} ms)  {name}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
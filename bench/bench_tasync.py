@@ -0,0 +1,98 @@
+import argparse
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import ENGINES, Interpreter
+
+ORTAK = """
+dahil "tcore"
+dahil "thttp"
+dahil "tasync"
+
+fonksiyon getir(i):
+    don metin_uzunluk(http_get(metin_birlesik(adres, metin(i))))
+bitti
+"""
+
+SERI = """
+toplam = 0
+icin i = 0, istek_sayisi:
+    toplam = toplam + getir(i)
+bitti
+"""
+
+GOREV = """
+gorevler = dizi_olustur()
+icin i = 0, istek_sayisi:
+    dizi_ekle(gorevler, gorev_baslat("getir", i))
+bitti
+sonuclar = hepsini_bekle(gorevler)
+toplam = 0
+icin i = 0, istek_sayisi:
+    toplam = toplam + sonuclar[i]
+bitti
+"""
+
+
+def serve(delay_ms: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            # Yavas bir dis servisi taklit eder.
+            time.sleep(delay_ms / 1000.0)
+            body = b"x" * 100
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    class Server(ThreadingHTTPServer):
+        # Varsayilan dinleme kuyrugu (5) ayni anda gelen baglantilari 1 s geri cevirir.
+        request_queue_size = 256
+
+    server = Server(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(source: str, url: str, requests: int, engine: str) -> float:
+    interp = Interpreter(engine=engine)
+    interp.globals.update({"adres": url, "istek_sayisi": requests})
+    interp.run(ORTAK)
+    start = time.perf_counter()
+    interp.run(source)
+    elapsed = time.perf_counter() - start
+    assert interp.globals["toplam"] == 100 * requests
+    return elapsed
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="tasync gorevleriyle es zamanli http_get, seri cagrilara karsi")
+    p.add_argument("--istek", type=int, default=50)
+    p.add_argument("--gecikme-ms", type=float, default=100.0, help="Sunucunun her yanittan once bekledigi sure")
+    p.add_argument("--engine", choices=ENGINES, default="tree")
+    args = p.parse_args()
+
+    server = serve(args.gecikme_ms)
+    url = f"http://127.0.0.1:{server.server_address[1]}/kayit/"
+    try:
+        serial = run(SERI, url, args.istek, args.engine)
+        tasks = run(GOREV, url, args.istek, args.engine)
+    finally:
+        server.shutdown()
+    print(f"{args.istek} istek, istek basina {args.gecikme_ms:.0f} ms gecikme, motor: {args.engine}")
+    print(f"{'seri':10} {serial:8.2f} s")
+    print(f"{'gorevler':10} {tasks:8.2f} s  ({serial / tasks:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
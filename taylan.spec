@@ -10,6 +10,7 @@ a = Analysis(
         'taylan_std.web',
         'taylan_std.sqlite',
         'taylan_std.auth',
+        'taylan_std.parallel',
     ],
     hookspath=[],
     hooksconfig={},
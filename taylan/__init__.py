@@ -1 +1,3 @@
+__version__ = "1.0.0"
+
 __all__ = ["core", "config", "installer"]
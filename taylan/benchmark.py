@@ -0,0 +1,328 @@
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from taylan import __version__
+from taylan.core.cache import load_program
+from taylan.core.interpreter import Interpreter, Program, parse_source
+from taylan.core.optimizer import optimize as optimize_program
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SUITE_DIR = os.path.join(ROOT, "bench", "suite")
+
+
+class Workload:
+    def __init__(self, name: str, file: str, description: str, prelude: Optional[str] = None) -> None:
+        self.name = name
+        self.file = file
+        self.description = description
+        # On yukleme (ornegin transpiler tanimlari) her tekrarda olculmeden calistirilir.
+        self.prelude = prelude
+
+
+WORKLOADS: List[Workload] = [
+    Workload("fib", "fib.tay", "Ozyinelemeli fib(20)"),
+    Workload("dongu", "dongu.tay", "Ic ice dongu, 300x300 aritmetik"),
+    Workload("icin", "icin.tay", "dongu isinin sayacli icin dongusu hali"),
+    Workload("metin", "metin.tay", "metin_birlesik ile 20000 karakterlik metin"),
+    Workload("tsql", "tsql.tay", "tsql: 2000 ekleme, 10 secim"),
+    Workload("tml", "tml.tay", "tml: 200 ornek, 200 epoch dogrusal model"),
+    Workload(
+        "selfhost",
+        "selfhost.tay",
+        "Selfhost transpiler: uc ornek, 5 tur",
+        prelude=os.path.join("selfhost", "transpiler_v0.tay"),
+    ),
+]
+
+
+def _read(path: str) -> str:
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return f.read()
+
+
+def summarize(times_ms: List[float]) -> Dict[str, Any]:
+    return {
+        "times_ms": times_ms,
+        "mean_ms": statistics.mean(times_ms),
+        "median_ms": statistics.median(times_ms),
+        "stddev_ms": statistics.stdev(times_ms) if len(times_ms) > 1 else 0.0,
+        "min_ms": min(times_ms),
+    }
+
+
+def metadata(optimize: bool, warmup: int, repeat: int) -> Dict[str, Any]:
+    return {
+        "taylan": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "optimize": optimize,
+        "warmup": warmup,
+        "repeat": repeat,
+    }
+
+
+# Her tekrar taze bir Interpreter'da kosar; cagri noktasi onbellekleri ve
+# globaller tekrarlar arasinda tasinmaz. Olculen sure yalnizca programin
+# run_program'idir (ayristirma, -O iyilestirmesi ve on yukleme haric).
+def time_program(
+    program: Program,
+    base_dir: str,
+    engine: str = "tree",
+    optimize: bool = False,
+    warmup: int = 1,
+    repeat: int = 5,
+    prelude: Optional[Program] = None,
+    globals_: Optional[Dict[str, Any]] = None,
+) -> List[float]:
+    if optimize:
+        program = optimize_program(program)
+        if prelude is not None:
+            prelude = optimize_program(prelude)
+    times_ms: List[float] = []
+    for i in range(warmup + repeat):
+        interp = Interpreter(base_dir=base_dir, engine=engine)
+        if globals_:
+            interp.globals.update(globals_)
+        with contextlib.redirect_stdout(io.StringIO()):
+            if prelude is not None:
+                interp.run_program(prelude)
+            start = time.perf_counter()
+            interp.run_program(program)
+            elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times_ms.append(elapsed * 1000)
+    return times_ms
+
+
+# Takim isleri bos bir gecici klasorde calisir; tsql/tml dosyalari calisma
+# klasorunu kirletmez.
+def run_workload(
+    workload: Workload,
+    engine: str = "tree",
+    optimize: bool = False,
+    warmup: int = 1,
+    repeat: int = 5,
+    suite_dir: str = SUITE_DIR,
+) -> Dict[str, Any]:
+    program = parse_source(_read(os.path.join(suite_dir, workload.file)))
+    prelude = parse_source(_read(os.path.join(ROOT, workload.prelude))) if workload.prelude else None
+    cwd = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="taylan-bench-")
+    try:
+        os.chdir(work_dir)
+        times_ms = time_program(
+            program,
+            ROOT,
+            engine=engine,
+            optimize=optimize,
+            warmup=warmup,
+            repeat=repeat,
+            prelude=prelude,
+            globals_={"bench_kok": ROOT},
+        )
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    result = summarize(times_ms)
+    result["description"] = workload.description
+    return result
+
+
+def run_suite(
+    names: Optional[List[str]] = None,
+    engines: Optional[List[str]] = None,
+    optimize: bool = False,
+    warmup: int = 1,
+    repeat: int = 5,
+    progress: Any = None,
+) -> Dict[str, Any]:
+    workloads = [w for w in WORKLOADS if not names or w.name in names]
+    engines = engines or ["tree"]
+    results: Dict[str, Dict[str, Any]] = {}
+    for engine in engines:
+        results[engine] = {}
+        for w in workloads:
+            res = run_workload(w, engine=engine, optimize=optimize, warmup=warmup, repeat=repeat)
+            results[engine][w.name] = res
+            if progress is not None:
+                progress(engine, w.name, res)
+    data = metadata(optimize, warmup, repeat)
+    data["results"] = results
+    return data
+
+
+# Kullanici dosyalari `calistir` gibi gecerli klasorde calisir.
+def run_files(
+    paths: List[str],
+    engines: Optional[List[str]] = None,
+    optimize: bool = False,
+    warmup: int = 1,
+    repeat: int = 10,
+    use_cache: bool = True,
+    progress: Any = None,
+) -> Dict[str, Any]:
+    engines = engines or ["tree"]
+    programs = [(path, load_program(path, _read(path), use_cache=use_cache)) for path in paths]
+    results: Dict[str, Dict[str, Any]] = {}
+    for engine in engines:
+        results[engine] = {}
+        for path, program in programs:
+            times_ms = time_program(
+                program, os.getcwd(), engine=engine, optimize=optimize, warmup=warmup, repeat=repeat
+            )
+            res = summarize(times_ms)
+            results[engine][path] = res
+            if progress is not None:
+                progress(engine, path, res)
+    data = metadata(optimize, warmup, repeat)
+    data["results"] = results
+    return data
+
+
+def format_row(engine: str, name: str, res: Dict[str, Any], width: int = 10) -> str:
+    return (
+        f"{engine:8} {name:{width}} {res['mean_ms']:10.2f} {res['median_ms']:10.2f}"
+        f" {res['stddev_ms']:9.2f} {res['min_ms']:10.2f}"
+    )
+
+
+def format_header(width: int = 10) -> str:
+    return f"{'motor':8} {'is':{width}} {'ort ms':>10} {'medyan ms':>10} {'sapma ms':>9} {'en az ms':>10}"
+
+
+def write_results(data: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def read_results(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _exact_u_counts(m: int, n: int) -> List[int]:
+    # counts[i][j][u]: i ve j elemanli orneklerde U = u veren siralama sayisi.
+    prev = [[1] for _ in range(n + 1)]
+    for i in range(1, m + 1):
+        cur = [[1]]
+        for j in range(1, n + 1):
+            size = i * j + 1
+            row = [0] * size
+            left = prev[j]
+            for u, c in enumerate(left):
+                if u + j < size:
+                    row[u + j] += c
+            for u, c in enumerate(cur[j - 1]):
+                row[u] += c
+            cur.append(row)
+        prev = cur
+    return prev[n]
+
+
+# Mann-Whitney U testi, tek yonlu: H1 "b'deki sureler a'dakilerden buyuk".
+# Kucuk orneklerde (esitlik yoksa) tam dagilim, aksi halde esitlik duzeltmeli
+# normal yaklasim kullanilir. Donus: (U, p).
+def mann_whitney_greater(a: List[float], b: List[float]) -> Tuple[float, float]:
+    m, n = len(a), len(b)
+    if m == 0 or n == 0:
+        return 0.0, 1.0
+    u = 0.0
+    for y in b:
+        for x in a:
+            if y > x:
+                u += 1.0
+            elif y == x:
+                u += 0.5
+    values = sorted(a + b)
+    ties = []
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1] == values[i]:
+            j += 1
+        if j > i:
+            ties.append(j - i + 1)
+        i = j + 1
+    if not ties and m * n <= 400:
+        counts = _exact_u_counts(m, n)
+        total = sum(counts)
+        return u, sum(counts[int(u):]) / total
+    big_n = m + n
+    tie_term = sum(t ** 3 - t for t in ties) / (big_n * (big_n - 1))
+    variance = m * n / 12.0 * ((big_n + 1) - tie_term)
+    if variance <= 0:
+        return u, 1.0
+    z = (u - m * n / 2.0 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+# Yavaslama ancak medyan degisimi esigi asiyor ve fark istatistiksel olarak
+# anlamliysa (p < alpha) isaretlenir; gurultulu tek olcumler CI'yi kirmaz.
+def compare_results(
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    threshold: float = 0.05,
+    alpha: float = 0.05,
+) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for engine, items in new.get("results", {}).items():
+        old_items = old.get("results", {}).get(engine, {})
+        for name, res in items.items():
+            if name not in old_items:
+                continue
+            before = old_items[name]
+            change = res["median_ms"] / before["median_ms"] - 1.0 if before["median_ms"] > 0 else 0.0
+            _, p_slower = mann_whitney_greater(before["times_ms"], res["times_ms"])
+            _, p_faster = mann_whitney_greater(res["times_ms"], before["times_ms"])
+            if change > threshold and p_slower < alpha:
+                status = "yavasladi"
+            elif change < -threshold and p_faster < alpha:
+                status = "hizlandi"
+            else:
+                status = "ayni"
+            rows.append(
+                {
+                    "engine": engine,
+                    "name": name,
+                    "old_median_ms": before["median_ms"],
+                    "new_median_ms": res["median_ms"],
+                    "change": change,
+                    "p_value": p_slower if change >= 0 else p_faster,
+                    "status": status,
+                }
+            )
+    return rows
+
+
+ENVIRONMENT_KEYS = ("taylan", "python", "implementation", "platform", "cpu_count", "optimize")
+
+
+def environment_diff(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    out = []
+    for key in ENVIRONMENT_KEYS:
+        if old.get(key) != new.get(key):
+            out.append(f"{key}: {old.get(key)} -> {new.get(key)}")
+    return out
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    width = max([len(r["name"]) for r in rows] + [2])
+    out = [f"{'motor':8} {'is':{width}} {'eski ms':>10} {'yeni ms':>10} {'degisim':>9} {'p':>7}  durum"]
+    for r in rows:
+        out.append(
+            f"{r['engine']:8} {r['name']:{width}} {r['old_median_ms']:10.2f} {r['new_median_ms']:10.2f}"
+            f" {r['change'] * 100:+8.1f}% {r['p_value']:7.4f}  {r['status']}"
+        )
+    return "\n".join(out)
@@ -1,31 +1,12 @@
 ﻿import argparse
 import os
-import importlib
-
-from taylan.core.interpreter import Interpreter
-from taylan.installer import install_optional_modules, LIB_SOURCES
-from taylan.native_compiler import build_native, NativeCompileError
-
-
-
-def _load_stdlib():
-    modules = [
-        "taylan_std.sql",
-        "taylan_std.math",
-        "taylan_std.ml",
-        "taylan_std.data",
-        "taylan_std.date",
-        "taylan_std.img",
-        "taylan_std.game",
-        "taylan_std.http",
-        "taylan_std.async",
-        "taylan_std.json",
-        "taylan_std.config",
-        "taylan_std.log",
-        "taylan_std.core",
-    ]
-    for m in modules:
-        importlib.import_module(m)
+import sys
+
+# Baslangic suresi icin yalnizca arguman ayristirmanin ihtiyaci olan moduller
+# burada yuklenir; her komut kendi bagimliliklarini kendi icinde ice aktarir.
+# Stdlib modulleri zaten ancak bir betik `dahil` ettiginde yuklenir.
+from taylan.core.interpreter import ENGINES
+from taylan.installer import LIB_SOURCES
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,6 +15,59 @@ def parse_args() -> argparse.Namespace:
 
     run = sub.add_parser("calistir", help=".tay dosyasini calistir")
     run.add_argument("file", help="Calistirilacak dosya")
+    run.add_argument("--engine", default="tree", choices=ENGINES, help="Yurutme motoru (vars: tree)")
+    run.add_argument("--vm", action="store_true", help="Bytecode VM ile calistir (--engine vm)")
+    run.add_argument("--no-cache", action="store_true", help="Derlenmis program onbellegini kullanma")
+    run.add_argument("-O", dest="optimize", action="store_true", help="AST iyilestiricisini calistir")
+    run.add_argument("--istatistik", action="store_true", help="Cagri onbellegi ve hizlandirma sayaclarini yazdir")
+
+    cache = sub.add_parser("onbellek", help="Derlenmis program onbellegini yonet")
+    cache.add_argument("action", choices=["temizle"], help="Yapilacak islem")
+    cache.add_argument("dir", nargs="?", default=".", help="Taranacak klasor (vars: .)")
+
+    prof = sub.add_parser("profil", help="Programi calistir, fonksiyon/satir surelerini raporla")
+    prof.add_argument("file", help="Profillenecek .tay dosyasi")
+    prof.add_argument("--json", default="", help="JSON rapor yolu (vars: dosya.profil.json)")
+    prof.add_argument("--limit", type=int, default=20, help="Tablo basina gosterilecek satir (vars: 20)")
+    prof.add_argument("--no-cache", action="store_true", help="Derlenmis program onbellegini kullanma")
+    prof.add_argument("-O", dest="optimize", action="store_true", help="AST iyilestiricisini calistir")
+
+    samp = sub.add_parser("ornekle", help="Ornekleyen profil: flamegraph icin collapsed-stack cikti")
+    samp.add_argument("file", help="Calistirilacak .tay dosyasi")
+    samp.add_argument("--engine", default="tree", choices=("tree", "python"), help="Yurutme motoru (vars: tree)")
+    samp.add_argument("--aralik", type=float, default=5.0, help="Ornekleme araligi, ms (vars: 5)")
+    samp.add_argument("-o", "--out", default="", help="Cikti yolu (vars: dosya.collapsed)")
+    samp.add_argument("--yaz", type=float, default=10.0, help="Ciktiyi kac saniyede bir yaz; 0 = sadece sonda (vars: 10)")
+    samp.add_argument("--no-cache", action="store_true", help="Derlenmis program onbellegini kullanma")
+    samp.add_argument("-O", dest="optimize", action="store_true", help="AST iyilestiricisini calistir")
+
+    bench = sub.add_parser("bench", help="Olcum takimini calistir (bench/suite)")
+    bench.add_argument("names", nargs="*", help="Calistirilacak isler (vars: hepsi)")
+    bench.add_argument("--engine", nargs="+", default=["tree"], choices=ENGINES, help="Yurutme motorlari (vars: tree)")
+    bench.add_argument("--tekrar", type=int, default=5, help="Olculen tekrar sayisi (vars: 5)")
+    bench.add_argument("--isinma", type=int, default=1, help="Olculmeyen isinma turu (vars: 1)")
+    bench.add_argument("--json", default="bench_sonuc.json", help="Sonuc dosyasi (vars: bench_sonuc.json)")
+    bench.add_argument("--liste", action="store_true", help="Isleri listele ve cik")
+    bench.add_argument("-O", dest="optimize", action="store_true", help="AST iyilestiricisini calistir")
+
+    timing = sub.add_parser("zamanla", help="Dosyalarin calisma suresini olc veya iki olcumu karsilastir")
+    timing.add_argument("files", nargs="*", help="Olculecek .tay dosyalari")
+    timing.add_argument("--karsilastir", nargs=2, metavar=("ESKI", "YENI"), help="Iki JSON olcumunu karsilastir")
+    timing.add_argument("--engine", nargs="+", default=["tree"], choices=ENGINES, help="Yurutme motorlari (vars: tree)")
+    timing.add_argument("--tekrar", type=int, default=10, help="Olculen tekrar sayisi (vars: 10)")
+    timing.add_argument("--isinma", type=int, default=1, help="Olculmeyen isinma turu (vars: 1)")
+    timing.add_argument("-o", "--out", default="zamanla.json", help="Sonuc dosyasi (vars: zamanla.json)")
+    timing.add_argument("--esik", type=float, default=5.0, help="Yavaslama esigi, yuzde (vars: 5)")
+    timing.add_argument("--alfa", type=float, default=0.05, help="Anlamlilik duzeyi (vars: 0.05)")
+    timing.add_argument("--no-cache", action="store_true", help="Derlenmis program onbellegini kullanma")
+    timing.add_argument("-O", dest="optimize", action="store_true", help="AST iyilestiricisini calistir")
+
+    # Editorun sicak isci sureci; kullaniciya yonelik degil (taylan/worker.py).
+    sub.add_parser("isci")
+
+    disasm = sub.add_parser("disasm", help="Uretilen bytecode'u goster")
+    disasm.add_argument("file", help="Incelenecek .tay dosyasi")
+    disasm.add_argument("-O", dest="optimize", action="store_true", help="AST iyilestiricisini calistir")
 
     inst = sub.add_parser("kur", help="Opsiyonel modul kur")
     inst.add_argument("--all", action="store_true", help="Tum modulleri kur")
@@ -48,6 +82,8 @@ def parse_args() -> argparse.Namespace:
         default=os.path.join("selfhost", "transpiler_v0.tay"),
         help="Taylan transpiler yolu",
     )
+    selfhost.add_argument("--engine", default="tree", choices=ENGINES, help="Yurutme motoru (vars: tree)")
+    selfhost.add_argument("-O", dest="optimize", action="store_true", help="AST iyilestiricisini calistir")
 
     native = sub.add_parser("native", help="Taylan kodunu C ve native binary'ye derle (MVP)")
     native.add_argument("file", help="Derlenecek .tay dosyasi")
@@ -55,22 +91,217 @@ def parse_args() -> argparse.Namespace:
     native.add_argument("--c-out", default="", help="Uretilecek C dosyasi yolu")
     native.add_argument("--cc", default="gcc", help="C derleyicisi komutu (vars: gcc)")
     native.add_argument("--emit-c-only", action="store_true", help="Sadece C kodu uret")
+    native.add_argument("-O", dest="optimize", action="store_true", help="AST iyilestiricisini calistir")
 
     return p.parse_args()
 
 
-def cmd_run(path: str) -> int:
+def cmd_run(
+    path: str,
+    engine: str = "tree",
+    use_cache: bool = True,
+    optimize: bool = False,
+    stats: bool = False,
+) -> int:
+    from taylan.core.cache import load_program
+    from taylan.core.interpreter import Interpreter
+
     if not os.path.exists(path):
         print(f"Dosya yok: {path}")
         return 1
     with open(path, "r", encoding="utf-8-sig") as f:
         src = f.read()
-    interp = Interpreter(base_dir=os.getcwd())
-    interp.run(src)
+    program = load_program(path, src, use_cache=use_cache)
+    interp = Interpreter(base_dir=os.getcwd(), engine=engine, optimize=optimize, use_cache=use_cache)
+    try:
+        interp.run_program(program)
+    finally:
+        if stats:
+            calls = interp.call_stats
+            quick = interp.quicken_stats
+            print(f"Cagri onbellegi: {calls.hits} isabet, {calls.misses} cozumleme", file=sys.stderr)
+            print(
+                f"Hizlandirma: {quick.specialized} ozellesen, {quick.deoptimized} geri donen,"
+                f" {quick.polymorphic} cok turlu BinOp",
+                file=sys.stderr,
+            )
+    return 0
+
+
+def cmd_profile(args: argparse.Namespace) -> int:
+    from taylan.core.cache import load_program
+    from taylan.core.profiler import ProfilingInterpreter, format_report, write_report
+
+    if not os.path.exists(args.file):
+        print(f"Dosya yok: {args.file}")
+        return 1
+    with open(args.file, "r", encoding="utf-8-sig") as f:
+        src = f.read()
+    program = load_program(args.file, src, use_cache=not args.no_cache)
+    interp = ProfilingInterpreter(
+        base_dir=os.getcwd(), optimize=args.optimize, use_cache=not args.no_cache, path=args.file
+    )
+    try:
+        interp.run_program(program)
+    finally:
+        report = interp.report(src.splitlines())
+        json_path = args.json or os.path.splitext(args.file)[0] + ".profil.json"
+        write_report(report, json_path)
+        print()
+        print(format_report(report, args.limit))
+        print(f"JSON rapor: {json_path}")
+    return 0
+
+
+def cmd_sample(args: argparse.Namespace) -> int:
+    import signal
+
+    from taylan.core.cache import load_program
+    from taylan.core.interpreter import Interpreter
+    from taylan.core.sampler import Sampler
+
+    if not os.path.exists(args.file):
+        print(f"Dosya yok: {args.file}")
+        return 1
+    with open(args.file, "r", encoding="utf-8-sig") as f:
+        src = f.read()
+    program = load_program(args.file, src, use_cache=not args.no_cache)
+    out_path = args.out or os.path.splitext(args.file)[0] + ".collapsed"
+    interp = Interpreter(
+        base_dir=os.getcwd(), engine=args.engine, optimize=args.optimize, use_cache=not args.no_cache
+    )
+    # Sunucular (tweb_baslat) genelde SIGTERM ile durdurulur; cikti yine de yazilsin.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    sampler = Sampler(interval=args.aralik / 1000.0, output=out_path, flush_every=args.yaz)
+    code = 0
+    try:
+        with sampler:
+            interp.run_program(program)
+    except KeyboardInterrupt:
+        code = 130
+    print(f"Ornek sayisi: {sampler.samples}")
+    print(f"Collapsed-stack cikti: {out_path} (flamegraph.pl {out_path} > flame.svg)")
+    return code
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    from taylan.benchmark import WORKLOADS, format_header, format_row, run_suite, write_results
+
+    if args.liste:
+        for w in WORKLOADS:
+            print(f"{w.name:10} {w.description}")
+        return 0
+    known = {w.name for w in WORKLOADS}
+    unknown = [n for n in args.names if n not in known]
+    if unknown:
+        print(f"Bilinmeyen is: {', '.join(unknown)}")
+        return 1
+    if args.tekrar < 1:
+        print("--tekrar en az 1 olmali")
+        return 1
+    print(format_header())
+    data = run_suite(
+        args.names,
+        args.engine,
+        optimize=args.optimize,
+        warmup=args.isinma,
+        repeat=args.tekrar,
+        progress=lambda engine, name, res: print(format_row(engine, name, res), flush=True),
+    )
+    write_results(data, args.json)
+    print(f"Sonuclar yazildi: {args.json}")
+    return 0
+
+
+def cmd_timing(args: argparse.Namespace) -> int:
+    from taylan.benchmark import (
+        compare_results,
+        environment_diff,
+        format_comparison,
+        format_header,
+        format_row,
+        read_results,
+        run_files,
+        write_results,
+    )
+
+    if args.karsilastir:
+        for path in args.karsilastir:
+            if not os.path.exists(path):
+                print(f"Dosya yok: {path}")
+                return 1
+        old, new = (read_results(p) for p in args.karsilastir)
+        for line in environment_diff(old, new):
+            print(f"Uyari: ortam farkli, {line}")
+        rows = compare_results(old, new, threshold=args.esik / 100.0, alpha=args.alfa)
+        if not rows:
+            print("Karsilastirilacak ortak olcum yok")
+            return 1
+        print(format_comparison(rows))
+        slower = [r for r in rows if r["status"] == "yavasladi"]
+        if slower:
+            print(f"Yavaslama: {len(slower)} olcum %{args.esik:g} esigini asti (p < {args.alfa:g})")
+            return 1
+        print("Yavaslama yok")
+        return 0
+
+    if not args.files:
+        print("Olculecek dosya verilmedi")
+        return 1
+    for path in args.files:
+        if not os.path.exists(path):
+            print(f"Dosya yok: {path}")
+            return 1
+    if args.tekrar < 1:
+        print("--tekrar en az 1 olmali")
+        return 1
+    width = max(len(p) for p in args.files)
+    print(format_header(width))
+    data = run_files(
+        args.files,
+        args.engine,
+        optimize=args.optimize,
+        warmup=args.isinma,
+        repeat=args.tekrar,
+        use_cache=not args.no_cache,
+        progress=lambda engine, name, res: print(format_row(engine, name, res, width), flush=True),
+    )
+    write_results(data, args.out)
+    print(f"Sonuclar yazildi: {args.out}")
+    return 0
+
+
+def cmd_cache(args: argparse.Namespace) -> int:
+    from taylan.core.cache import clear_cache
+
+    removed = clear_cache(args.dir)
+    print(f"Onbellek temizlendi: {removed} klasor")
+    return 0
+
+
+def cmd_disasm(path: str, optimize_ast: bool = False) -> int:
+    from taylan.core.interpreter import parse_source
+    from taylan.core.optimizer import optimize
+    from taylan.core.vm import compile_program, disassemble
+
+    if not os.path.exists(path):
+        print(f"Dosya yok: {path}")
+        return 1
+    with open(path, "r", encoding="utf-8-sig") as f:
+        src = f.read()
+    program = parse_source(src)
+    if optimize_ast:
+        program = optimize(program)
+    print(disassemble(compile_program(program)))
     return 0
 
 
 def cmd_selfhost(args: argparse.Namespace) -> int:
+    import tempfile
+
+    from taylan.core.interpreter import Interpreter
+    from taylan.core.optimizer import optimize_source
+
     if not os.path.exists(args.file):
         print(f"Dosya yok: {args.file}")
         return 1
@@ -86,9 +317,20 @@ def cmd_selfhost(args: argparse.Namespace) -> int:
     with open(args.transpiler, "r", encoding="utf-8-sig") as f:
         transpiler_src = f.read()
 
-    interp = Interpreter(base_dir=os.getcwd())
+    interp = Interpreter(base_dir=os.getcwd(), engine=args.engine, optimize=args.optimize)
     interp.run(transpiler_src)
-    result = interp.call_function("selfhost_derle", [args.file, out_path])
+    if args.optimize:
+        with open(args.file, "r", encoding="utf-8-sig") as f:
+            src = optimize_source(f.read())
+        fd, tmp_path = tempfile.mkstemp(suffix=".tay")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                f.write(src)
+            result = interp.call_function("selfhost_derle", [tmp_path, out_path])
+        finally:
+            os.remove(tmp_path)
+    else:
+        result = interp.call_function("selfhost_derle", [args.file, out_path])
     if result:
         print(result)
     print(f"Selfhost derleme tamamlandi: {out_path}")
@@ -96,6 +338,8 @@ def cmd_selfhost(args: argparse.Namespace) -> int:
 
 
 def cmd_native(args: argparse.Namespace) -> int:
+    from taylan.native_compiler import build_native, NativeCompileError
+
     if not os.path.exists(args.file):
         print(f"Dosya yok: {args.file}")
         return 1
@@ -106,6 +350,7 @@ def cmd_native(args: argparse.Namespace) -> int:
             c_out=args.c_out or None,
             cc=args.cc,
             emit_c_only=bool(args.emit_c_only),
+            optimize=args.optimize,
         )
     except NativeCompileError as e:
         print(f"Native derleme hatasi: {e}")
@@ -118,6 +363,8 @@ def cmd_native(args: argparse.Namespace) -> int:
 
 
 def cmd_install(args: argparse.Namespace) -> int:
+    from taylan.installer import install_optional_modules
+
     project_root = os.getcwd()
     packages_dir = os.path.join(project_root, "taylan_packages")
     selected = []
@@ -138,9 +385,36 @@ def cmd_install(args: argparse.Namespace) -> int:
 
 
 def main() -> int:
+    if getattr(sys, "frozen", False):
+        # Paketlenmis exe'de tparallel iscileri ayni exe'yi yeniden baslatir.
+        import multiprocessing
+
+        multiprocessing.freeze_support()
     args = parse_args()
     if args.cmd == "calistir":
-        return cmd_run(args.file)
+        return cmd_run(
+            args.file,
+            "vm" if args.vm else args.engine,
+            use_cache=not args.no_cache,
+            optimize=args.optimize,
+            stats=args.istatistik,
+        )
+    if args.cmd == "profil":
+        return cmd_profile(args)
+    if args.cmd == "ornekle":
+        return cmd_sample(args)
+    if args.cmd == "bench":
+        return cmd_bench(args)
+    if args.cmd == "zamanla":
+        return cmd_timing(args)
+    if args.cmd == "isci":
+        from taylan.worker import serve
+
+        return serve()
+    if args.cmd == "onbellek":
+        return cmd_cache(args)
+    if args.cmd == "disasm":
+        return cmd_disasm(args.file, args.optimize)
     if args.cmd == "kur":
         return cmd_install(args)
     if args.cmd == "selfhost":
@@ -149,7 +423,14 @@ def main() -> int:
         return cmd_native(args)
 
     print("Kullanim:")
-    print("  taylan calistir dosya.tay")
+    print("  taylan calistir dosya.tay [-O]")
+    print("  taylan profil dosya.tay")
+    print("  taylan ornekle dosya.tay -o profil.collapsed")
+    print("  taylan bench --engine tree python")
+    print("  taylan zamanla a.tay b.tay -o yeni.json")
+    print("  taylan zamanla --karsilastir eski.json yeni.json --esik 5")
+    print("  taylan disasm dosya.tay")
+    print("  taylan onbellek temizle")
     print("  taylan kur --with-sql")
     print("  taylan selfhost dosya.tay -o dosya.py")
     print("  taylan native dosya.tay -o uygulama")
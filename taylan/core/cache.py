@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+from typing import Optional
+
+from taylan import __version__
+
+from .interpreter import Program, parse_source
+
+CACHE_DIR = "__taylancache__"
+# AST dugumleri degistiginde artirilir; eski onbellek dosyalari gecersiz olur.
+CACHE_FORMAT = 3
+CACHE_TAG = f"taylan-{__version__}-f{CACHE_FORMAT}-py{sys.version_info[0]}{sys.version_info[1]}"
+
+
+def source_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def cache_path(path: str) -> str:
+    folder, name = os.path.split(os.path.abspath(path))
+    stem, _ = os.path.splitext(name)
+    return os.path.join(folder, CACHE_DIR, f"{stem}.{CACHE_TAG}.pickle")
+
+
+def load_cached(path: str, source: str) -> Optional[Program]:
+    cpath = cache_path(path)
+    try:
+        with open(cpath, "rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(data, dict):
+        return None
+    if data.get("tag") != CACHE_TAG or data.get("hash") != source_hash(source):
+        return None
+    program = data.get("program")
+    if not isinstance(program, Program):
+        return None
+    return program
+
+
+def store_cached(path: str, source: str, program: Program) -> bool:
+    # Yalnizca onbellek kacirildiginda gerekir; sicak yolda yuklenmez.
+    import tempfile
+
+    cpath = cache_path(path)
+    folder = os.path.dirname(cpath)
+    data = {"tag": CACHE_TAG, "hash": source_hash(source), "program": program}
+    tmp = None
+    try:
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            f = os.fdopen(fd, "wb")
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cpath)
+    except (OSError, pickle.PicklingError, RecursionError):
+        # Yarim kalan gecici dosya __taylancache__ icinde birikmesin.
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        return False
+    return True
+
+
+def load_program(path: str, source: str, use_cache: bool = True) -> Program:
+    if use_cache:
+        program = load_cached(path, source)
+        if program is not None:
+            return program
+    program = parse_source(source)
+    if use_cache:
+        store_cached(path, source, program)
+    return program
+
+
+def clear_cache(root: str) -> int:
+    import shutil
+
+    removed = 0
+    for folder, dirs, _ in os.walk(root):
+        if CACHE_DIR in dirs:
+            shutil.rmtree(os.path.join(folder, CACHE_DIR), ignore_errors=True)
+            dirs.remove(CACHE_DIR)
+            removed += 1
+    return removed
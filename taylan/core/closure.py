@@ -0,0 +1,486 @@
+from __future__ import annotations
+
+import operator
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .interpreter import (
+    Assign,
+    BinOp,
+    Bool,
+    Call,
+    CallSite,
+    ExprStmt,
+    For,
+    FuncDef,
+    If,
+    Import,
+    Index,
+    IndexAssign,
+    ListLiteral,
+    Node,
+    Number,
+    Program,
+    NORMAL,
+    QUICKENED_BINOPS,
+    Return,
+    String,
+    UnaryOp,
+    Var,
+    While,
+    _norm_name,
+    counted_range,
+)
+from .resolver import UNBOUND, Frame, FunctionLayout, function_layout, resolve
+
+Code = Callable[[Optional[Frame]], Any]
+
+_MISSING = object()
+
+
+def _ve(left: Any, right: Any) -> bool:
+    return bool(left) and bool(right)
+
+
+def _veya(left: Any, right: Any) -> bool:
+    return bool(left) or bool(right)
+
+
+BINARY_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "ve": _ve,
+    "veya": _veya,
+}
+
+UNARY_OPS: Dict[str, Callable[[Any], Any]] = {
+    "-": operator.neg,
+    "+": operator.pos,
+    "degil": operator.not_,
+}
+
+
+def may_return(body: List[Node]) -> bool:
+    for node in body:
+        if isinstance(node, Return):
+            return True
+        if isinstance(node, If):
+            if may_return(node.then_body) or (node.else_body is not None and may_return(node.else_body)):
+                return True
+        elif isinstance(node, (While, For)) and may_return(node.body):
+            return True
+    return False
+
+
+# Derlenen bloklar `don` icermiyorsa sonuclari yok sayilir. `don` icerebilen
+# bloklar NORMAL ya da donus degerini dondurur; boylece donus icin istisna
+# firlatilmaz ve donus icermeyen sicak dongulerde ek kontrol yapilmaz.
+class ClosureCompiler:
+    def __init__(self, interp: Any) -> None:
+        self.interp = interp
+        # Dugum de saklanir; boylece id() baska bir dugum icin yeniden kullanilamaz.
+        self.compiled: Dict[int, Tuple[FuncDef, FunctionLayout, Code]] = {}
+        self._layouts: Dict[int, Tuple[FuncDef, FunctionLayout]] = {}
+        self._layout: Optional[FunctionLayout] = None
+        self._stmt_table = {
+            Assign: self._assign,
+            ExprStmt: self._expr_stmt,
+            IndexAssign: self._index_assign,
+            If: self._if,
+            While: self._while,
+            For: self._for,
+            FuncDef: self._func_def,
+            Return: self._return,
+            Import: self._import,
+        }
+        self._expr_table = {
+            Number: self._const,
+            String: self._const,
+            Bool: self._const,
+            Var: self._var,
+            UnaryOp: self._unary,
+            BinOp: self._binop,
+            Call: self._call,
+            ListLiteral: self._list,
+            Index: self._index,
+        }
+        # Agac yorumlayicisi ayni AST'de BinOp dugumlerini hizlandirmis olabilir.
+        for cls in QUICKENED_BINOPS:
+            self._expr_table[cls] = self._binop
+
+    def compile_program(self, program: Program) -> Code:
+        resolver = resolve(program, self.interp)
+        resolver.raise_errors()
+        self._layouts.update(resolver.layouts)
+        return self.compile_block(program.body)
+
+    def run_program(self, program: Program) -> None:
+        self.compile_program(program)(None)
+
+    def compile_block(self, body: List[Node]) -> Code:
+        stmts: Tuple[Code, ...] = tuple(self.compile_stmt(s) for s in body)
+        if not stmts:
+            return lambda frame: NORMAL
+        if not may_return(body):
+            if len(stmts) == 1:
+                return stmts[0]
+
+            def run_block(frame: Optional[Frame]) -> Any:
+                for stmt in stmts:
+                    stmt(frame)
+                return NORMAL
+
+            return run_block
+
+        if len(stmts) == 1:
+            return stmts[0]
+        steps = tuple(zip(stmts, [may_return([s]) for s in body]))
+
+        def run_returning_block(frame: Optional[Frame]) -> Any:
+            for stmt, returns in steps:
+                if returns:
+                    result = stmt(frame)
+                    if result is not NORMAL:
+                        return result
+                else:
+                    stmt(frame)
+            return NORMAL
+
+        return run_returning_block
+
+    def compile_returning_block(self, body: List[Node]) -> Code:
+        code = self.compile_block(body)
+        if may_return(body) or not body:
+            return code
+
+        def run_block(frame: Optional[Frame]) -> Any:
+            code(frame)
+            return NORMAL
+
+        return run_block
+
+    def compile_stmt(self, node: Node) -> Code:
+        handler = self._stmt_table.get(type(node))
+        if handler is None:
+            raise RuntimeError("Bilinmeyen ifade")
+        return handler(node)
+
+    def compile_expr(self, node: Node) -> Code:
+        handler = self._expr_table.get(type(node))
+        if handler is None:
+            raise RuntimeError("Bilinmeyen ifade")
+        return handler(node)
+
+    def compile_function(self, func: FuncDef) -> Tuple[FunctionLayout, Code]:
+        entry = self.compiled.get(id(func))
+        if entry is None or entry[0] is not func:
+            resolved = self._layouts.get(id(func))
+            layout = resolved[1] if resolved is not None and resolved[0] is func else function_layout(func)
+            outer = self._layout
+            self._layout = layout
+            try:
+                entry = (func, layout, self.compile_returning_block(func.body))
+            finally:
+                self._layout = outer
+            self.compiled[id(func)] = entry
+        return entry[1], entry[2]
+
+    def call(self, func: FuncDef, args: List[Any]) -> Any:
+        if len(args) != len(func.params):
+            raise TypeError(f"{func.name} parametre sayisi uyusmuyor")
+        layout, body = self.compile_function(func)
+        result = body(layout.new_frame(args))
+        return None if result is NORMAL else result
+
+    def _store(self, name: str) -> Callable[[Optional[Frame], Any], None]:
+        layout = self._layout
+        if layout is None:
+            globals_ = self.interp.globals
+
+            def store_global(frame: Optional[Frame], value: Any) -> None:
+                globals_[name] = value
+
+            return store_global
+
+        slot = layout.slots[name]
+
+        def store_local(frame: Frame, value: Any) -> None:
+            frame.values[slot] = value
+
+        return store_local
+
+    def _assign(self, node: Assign) -> Code:
+        name = node.name
+        value = self.compile_expr(node.value)
+        if self._layout is None:
+            globals_ = self.interp.globals
+
+            def run_assign_global(frame: Optional[Frame]) -> None:
+                globals_[name] = value(frame)
+
+            return run_assign_global
+
+        slot = self._layout.slots[name]
+
+        def run_assign_local(frame: Frame) -> None:
+            frame.values[slot] = value(frame)
+
+        return run_assign_local
+
+    def _expr_stmt(self, node: ExprStmt) -> Code:
+        return self.compile_expr(node.expr)
+
+    def _index_assign(self, node: IndexAssign) -> Code:
+        target = self.compile_expr(node.target)
+        index = self.compile_expr(node.index)
+        value = self.compile_expr(node.value)
+
+        def run_index_assign(frame: Optional[Frame]) -> None:
+            v = value(frame)
+            target(frame)[index(frame)] = v
+
+        return run_index_assign
+
+    def _if(self, node: If) -> Code:
+        cond = self.compile_expr(node.cond)
+        if may_return([node]):
+            then_body = self.compile_returning_block(node.then_body)
+            if node.else_body is None:
+                def run_returning_if(frame: Optional[Frame]) -> Any:
+                    if cond(frame):
+                        return then_body(frame)
+                    return NORMAL
+
+                return run_returning_if
+
+            else_body = self.compile_returning_block(node.else_body)
+
+            def run_returning_if_else(frame: Optional[Frame]) -> Any:
+                if cond(frame):
+                    return then_body(frame)
+                return else_body(frame)
+
+            return run_returning_if_else
+
+        then_body = self.compile_block(node.then_body)
+        if node.else_body is None:
+            def run_if(frame: Optional[Frame]) -> None:
+                if cond(frame):
+                    then_body(frame)
+
+            return run_if
+
+        else_body = self.compile_block(node.else_body)
+
+        def run_if_else(frame: Optional[Frame]) -> None:
+            if cond(frame):
+                then_body(frame)
+            else:
+                else_body(frame)
+
+        return run_if_else
+
+    def _while(self, node: While) -> Code:
+        cond = self.compile_expr(node.cond)
+        if may_return(node.body):
+            returning_body = self.compile_block(node.body)
+
+            def run_returning_while(frame: Optional[Frame]) -> Any:
+                while cond(frame):
+                    result = returning_body(frame)
+                    if result is not NORMAL:
+                        return result
+                return NORMAL
+
+            return run_returning_while
+
+        body = self.compile_block(node.body)
+
+        def run_while(frame: Optional[Frame]) -> None:
+            while cond(frame):
+                body(frame)
+
+        return run_while
+
+    def _for(self, node: For) -> Code:
+        start = self.compile_expr(node.start)
+        end = self.compile_expr(node.end)
+        store = self._store(node.var)
+        if may_return(node.body):
+            returning_body = self.compile_block(node.body)
+
+            def run_returning_for(frame: Optional[Frame]) -> Any:
+                for value in counted_range(start(frame), end(frame)):
+                    store(frame, value)
+                    result = returning_body(frame)
+                    if result is not NORMAL:
+                        return result
+                return NORMAL
+
+            return run_returning_for
+
+        body = self.compile_block(node.body)
+        if self._layout is None:
+            globals_ = self.interp.globals
+            name = node.var
+
+            def run_for_global(frame: Optional[Frame]) -> None:
+                for value in counted_range(start(frame), end(frame)):
+                    globals_[name] = value
+                    body(frame)
+
+            return run_for_global
+
+        slot = self._layout.slots[node.var]
+
+        def run_for_local(frame: Frame) -> None:
+            values = frame.values
+            for value in counted_range(start(frame), end(frame)):
+                values[slot] = value
+                body(frame)
+
+        return run_for_local
+
+    def _func_def(self, node: FuncDef) -> Code:
+        self.compile_function(node)
+        functions = self.interp.functions
+        name = node.name
+
+        def run_func_def(frame: Optional[Frame]) -> None:
+            functions[name] = node
+
+        return run_func_def
+
+    def _return(self, node: Return) -> Code:
+        if not node.value:
+            return lambda frame: None
+
+        return self.compile_expr(node.value)
+
+    def _import(self, node: Import) -> Code:
+        name = node.name
+        import_module = self.interp._import_module
+        if self._layout is None:
+            globals_ = self.interp.globals
+
+            def run_import_global(frame: Optional[Frame]) -> None:
+                import_module(name, globals_)
+
+            return run_import_global
+
+        store = self._store(name)
+
+        def run_import_local(frame: Frame) -> None:
+            env: Dict[str, Any] = {}
+            import_module(name, env)
+            store(frame, env[name])
+
+        return run_import_local
+
+    def _const(self, node: Node) -> Code:
+        value = node.value
+        return lambda frame: value
+
+    def _var(self, node: Var) -> Code:
+        name = node.name
+        globals_ = self.interp.globals
+        layout = self._layout
+        if layout is None or name not in layout.slots:
+            def load_global(frame: Optional[Frame]) -> Any:
+                value = globals_.get(name, _MISSING)
+                if value is _MISSING:
+                    raise NameError(f"Tanımsız değişken: {name}")
+                return value
+
+            return load_global
+
+        slot = layout.slots[name]
+
+        def load_local(frame: Frame) -> Any:
+            value = frame.values[slot]
+            if value is UNBOUND:
+                value = globals_.get(name, _MISSING)
+                if value is _MISSING:
+                    raise NameError(f"Tanımsız değişken: {name}")
+            return value
+
+        return load_local
+
+    def _unary(self, node: UnaryOp) -> Code:
+        fn = UNARY_OPS.get(node.op)
+        if fn is None:
+            raise RuntimeError("Bilinmeyen ifade")
+        expr = self.compile_expr(node.expr)
+        return lambda frame: fn(expr(frame))
+
+    def _binop(self, node: BinOp) -> Code:
+        fn = BINARY_OPS.get(node.op)
+        if fn is None:
+            raise RuntimeError("Bilinmeyen ifade")
+        left = self.compile_expr(node.left)
+        if isinstance(node.right, (Number, String, Bool)):
+            const = node.right.value
+            return lambda frame: fn(left(frame), const)
+        right = self.compile_expr(node.right)
+        return lambda frame: fn(left(frame), right(frame))
+
+    def _list(self, node: ListLiteral) -> Code:
+        items = tuple(self.compile_expr(i) for i in node.items)
+        return lambda frame: [item(frame) for item in items]
+
+    def _index(self, node: Index) -> Code:
+        target = self.compile_expr(node.target)
+        if isinstance(node.index, (Number, String, Bool)):
+            const = node.index.value
+            return lambda frame: target(frame)[const]
+        index = self.compile_expr(node.index)
+        return lambda frame: target(frame)[index(frame)]
+
+    def _call(self, node: Call) -> Code:
+        name = node.name
+        norm = _norm_name(name)
+        args = tuple(self.compile_expr(a) for a in node.args)
+
+        if norm == "yazdir":
+            def run_print(frame: Optional[Frame]) -> None:
+                print(*[a(frame) for a in args])
+
+            return run_print
+
+        builtins = self.interp.builtins
+        functions = self.interp.functions
+        resolve_call_site = self.interp.resolve_call_site
+        stats = self.interp.call_stats
+        compiled = self.compiled
+        compile_function = self.compile_function
+        argc = len(args)
+        site = CallSite(name, argc)
+
+        def run_call(frame: Optional[Frame]) -> Any:
+            if site.functions_version != functions.version or site.builtins_version != builtins.version:
+                resolve_call_site(site)
+            else:
+                stats.hits += 1
+            builtin = site.builtin
+            if builtin is not None:
+                return builtin(*[a(frame) for a in args])
+            func = site.func
+            entry = compiled.get(id(func))
+            if entry is not None and entry[0] is func:
+                _, layout, body = entry
+            else:
+                layout, body = compile_function(func)
+            callee = Frame(layout.size)
+            callee.values[:argc] = [a(frame) for a in args]
+            result = body(callee)
+            return None if result is NORMAL else result
+
+        return run_call
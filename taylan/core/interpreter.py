@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, List, Dict, Optional
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Set, Tuple
+import operator
 import os
+import re
+import sys
 import json
+import functools
 import importlib
 
 
-def _norm_name(name: str) -> str:
-    table = str.maketrans({
+_NORM_TABLE = str.maketrans({
         0x131: "i",  # ?
         0x130: "i",  # ?
         0x11F: "g",  # ?
@@ -21,8 +25,11 @@ def _norm_name(name: str) -> str:
         0xD6: "o",   # ?
         0xE7: "c",   # ?
         0xC7: "c",   # ?
-    })
-    return name.translate(table)
+})
+
+
+def _norm_name(name: str) -> str:
+    return name.translate(_NORM_TABLE)
 
 
 STDLIB_MODULES = {
@@ -41,18 +48,21 @@ STDLIB_MODULES = {
     "tcore": "taylan_std.core",
     "tweb": "taylan_std.web",
     "tauth": "taylan_std.auth",
-    "tsqlite": "taylan_std.sqlite",
+    "tsqlite": "taylan_std.sqlite",
+    "tparallel": "taylan_std.parallel",
 }
 
+ENGINES = ("tree", "closure", "vm", "python")
+
 KEYWORDS = {
     "eger", "eğer", "degilse", "değilse", "bitti",
-    "dongu", "döngü", "fonksiyon", "don", "dön",
+    "dongu", "döngü", "icin", "için", "fonksiyon", "don", "dön",
     "dahil", "yazdir", "yazdır", "dogru", "doğru", "yanlis", "yanlış",
     "ve", "veya", "degil", "değil",
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: str
     value: Any
@@ -60,196 +70,291 @@ class Token:
     col: int
 
 
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<SPACE>[ \t\r]+)
+    |(?P<COMMENT>\#[^\n]*)
+    |(?P<NEWLINE>\n)
+    |(?P<NUMBER>\d+(?:\.\d*)?)
+    |(?P<STRING>"[^"\n]*")
+    |(?P<IDENT>[^\W\d]\w*)
+    |(?P<OP>==|!=|<=|>=|[-+*/%=()<>:,\[\]])
+    """,
+    re.VERBOSE,
+)
+
+
+TOKEN_TYPES = ("IDENT", "OP", "NEWLINE", "NUMBER", "STRING", "EOF")
+_TOKEN_CODES = {name: code for code, name in enumerate(TOKEN_TYPES)}
+
+
+# Token akisinin paralel dizilerle saklanan hali: tur kodu, deger, satir ve
+# sutun. Token nesneleri yalnizca okunurken uretilir; buyuk uretilmis
+# betiklerde token listesine gore cok daha az bellek kullanir.
+class TokenArray:
+    __slots__ = ("types", "values", "lines", "cols")
+
+    def __init__(self) -> None:
+        self.types = array("B")
+        self.values: List[Any] = []
+        self.lines = array("I")
+        self.cols = array("I")
+
+    def append(self, tok: Token) -> None:
+        self.types.append(_TOKEN_CODES[tok.type])
+        self.values.append(tok.value)
+        self.lines.append(tok.line)
+        self.cols.append(tok.col)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        return Token(TOKEN_TYPES[self.types[index]], self.values[index], self.lines[index], self.cols[index])
+
+    def __iter__(self) -> Iterator[Token]:
+        names = TOKEN_TYPES
+        for code, value, line, col in zip(self.types, self.values, self.lines, self.cols):
+            yield Token(names[code], value, line, col)
+
+
 class Lexer:
     def __init__(self, source: str) -> None:
         self.source = source
-        self.pos = 0
-        self.line = 1
-        self.col = 1
         self.tokens: List[Token] = []
 
-    def _peek(self) -> str:
-        if self.pos >= len(self.source):
-            return "\0"
-        return self.source[self.pos]
-
-    def _advance(self) -> str:
-        ch = self._peek()
-        self.pos += 1
-        if ch == "\n":
-            self.line += 1
-            self.col = 1
-        else:
-            self.col += 1
-        return ch
-
-    def _add(self, type_: str, value: Any, line: int, col: int) -> None:
-        self.tokens.append(Token(type_, value, line, col))
-
-    def lex(self) -> List[Token]:
-        while self.pos < len(self.source):
-            ch = self._peek()
-            if ch in " \t\r":
-                self._advance()
-                continue
-            if ch == "#":
-                while self._peek() not in "\n\0":
-                    self._advance()
-                continue
-            if ch == "\n":
-                line, col = self.line, self.col
-                self._advance()
-                self._add("NEWLINE", "\n", line, col)
-                continue
-            if ch.isdigit():
-                line, col = self.line, self.col
-                num = ""
-                while self._peek().isdigit():
-                    num += self._advance()
-                if self._peek() == ".":
-                    num += self._advance()
-                    while self._peek().isdigit():
-                        num += self._advance()
-                    self._add("NUMBER", float(num), line, col)
-                else:
-                    self._add("NUMBER", int(num), line, col)
-                continue
-            if ch == '"':
-                line, col = self.line, self.col
-                self._advance()
-                s = ""
-                while self._peek() not in "\0\n\"":
-                    s += self._advance()
-                if self._peek() != '"':
+    def iter_tokens(self) -> Iterator[Token]:
+        source = self.source
+        match = _TOKEN_RE.match
+        intern = sys.intern
+        end = len(source)
+        pos = 0
+        line = 1
+        line_start = 0
+        while pos < end:
+            m = match(source, pos)
+            if m is None:
+                ch = source[pos]
+                if ch == '"':
                     raise SyntaxError(f"String kapanmadı (satır {line})")
-                self._advance()
-                self._add("STRING", s, line, col)
-                continue
-            if ch.isalpha() or ch == "_":
-                line, col = self.line, self.col
-                ident = ""
-                while self._peek().isalnum() or self._peek() == "_" or self._peek() in "ğüşıöçĞÜŞİÖÇ":
-                    ident += self._advance()
-                self._add("IDENT", ident, line, col)
-                continue
-            line, col = self.line, self.col
-            two = self.source[self.pos:self.pos + 2]
-            if two in ("==", "!=", "<=", ">="):
-                self.pos += 2
-                self.col += 2
-                self._add("OP", two, line, col)
-                continue
-            if ch in "+-*/%=()<>:,":
-                self._advance()
-                self._add("OP", ch, line, col)
-                continue
-            raise SyntaxError(f"Bilinmeyen karakter: {ch} (satır {line})")
+                raise SyntaxError(f"Bilinmeyen karakter: {ch} (satır {line})")
+            kind = m.lastgroup
+            text = m.group()
+            col = pos - line_start + 1
+            pos = m.end()
+            if kind == "IDENT" or kind == "OP":
+                # Ayni ad ve operatorler tek bir str nesnesini paylasir (token ve AST).
+                yield Token(kind, intern(text), line, col)
+            elif kind == "NEWLINE":
+                yield Token("NEWLINE", "\n", line, col)
+                line += 1
+                line_start = pos
+            elif kind == "NUMBER":
+                yield Token("NUMBER", float(text) if "." in text else int(text), line, col)
+            elif kind == "STRING":
+                yield Token("STRING", text[1:-1], line, col)
+        yield Token("EOF", None, line, end - line_start + 1)
 
-        self._add("EOF", None, self.line, self.col)
+    def lex(self) -> List[Token]:
+        self.tokens = list(self.iter_tokens())
         return self.tokens
 
+    def lex_compact(self) -> TokenArray:
+        tokens = TokenArray()
+        append = tokens.append
+        for tok in self.iter_tokens():
+            append(tok)
+        return tokens
+
 
-@dataclass
+@dataclass(slots=True)
 class Node:
-    pass
+    line: int = field(default=0, compare=False, repr=False, kw_only=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class Program(Node):
     body: List[Node]
 
 
-@dataclass
+@dataclass(slots=True)
 class Number(Node):
     value: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class String(Node):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Bool(Node):
     value: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Var(Node):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Assign(Node):
     name: str
     value: Node
 
 
-@dataclass
+@dataclass(slots=True)
 class BinOp(Node):
     left: Node
     op: str
     right: Node
 
+    # Hizlandirma durumu sinif duzeyinde tutulur; dugumun sinifi degistirilerek
+    # (IntBinOp/FloatBinOp/PolyBinOp) guncellenir.
+    kind = None
+    quicken = True
 
-@dataclass
+
+@dataclass(slots=True)
 class UnaryOp(Node):
     op: str
     expr: Node
 
 
-@dataclass
+@dataclass(slots=True)
 class Call(Node):
     name: str
     args: List[Node]
 
 
-@dataclass
+@dataclass(slots=True)
+class ListLiteral(Node):
+    items: List[Node]
+
+
+@dataclass(slots=True)
+class Index(Node):
+    target: Node
+    index: Node
+
+
+@dataclass(slots=True)
 class If(Node):
     cond: Node
     then_body: List[Node]
     else_body: Optional[List[Node]]
 
 
-@dataclass
+@dataclass(slots=True)
 class While(Node):
     cond: Node
     body: List[Node]
 
 
-@dataclass
+# `icin i = bas, son:` ... `bitti`; i sirasiyla bas, bas + 1, ..., son - 1
+# degerlerini alir. Sinirlar dongu basinda bir kez degerlendirilir.
+@dataclass(slots=True)
+class For(Node):
+    var: str
+    start: Node
+    end: Node
+    body: List[Node]
+
+
+@dataclass(slots=True)
 class FuncDef(Node):
     name: str
     params: List[str]
     body: List[Node]
 
 
-@dataclass
+@dataclass(slots=True)
 class Return(Node):
     value: Optional[Node]
 
 
-@dataclass
+@dataclass(slots=True)
 class Import(Node):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExprStmt(Node):
     expr: Node
 
 
+# `a[i] = v`; deger, hedef ve indeksten once degerlendirilir.
+@dataclass(slots=True)
+class IndexAssign(Node):
+    target: Node
+    index: Node
+    value: Node
+
+
+# Agac yorumlayicisinin hizlandirma (quickening) dugumleri. Ayni turde
+# islenenlerle yeterince calisan bir BinOp, yerinde bu siniflardan birine
+# cevrilir: yalnizca tur korumasi ve tek bir operator cagrisi kalir. Koruma
+# tutmazsa dugum BinOp'a geri doner; surekli tur degistiren dugumler PolyBinOp
+# olur ve bir daha gozlenmez. Alanlar ayni oldugundan diger motorlar bu
+# dugumleri BinOp olarak gorur.
+class IntBinOp(BinOp):
+    __slots__ = ()
+    kind = int
+    quicken = False
+
+
+class FloatBinOp(BinOp):
+    __slots__ = ()
+    kind = float
+    quicken = False
+
+
+class PolyBinOp(BinOp):
+    __slots__ = ()
+    quicken = False
+
+
+QUICKENED_BINOPS = (IntBinOp, FloatBinOp, PolyBinOp)
+
+QUICK_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+QUICKEN_AFTER = 8
+QUICKEN_GIVE_UP = 64
+MAX_DEOPTS = 2
+
+
 class Parser:
-    def __init__(self, tokens: List[Token]) -> None:
-        self.tokens = tokens
-        self.pos = 0
+    def __init__(self, tokens: Iterable[Token]) -> None:
+        self._stream = iter(tokens)
+        self._ahead: List[Token] = []
+        self._cur = next(self._stream)
 
     def _peek(self) -> Token:
-        return self.tokens[self.pos]
+        return self._cur
+
+    def _peek_next(self) -> Token:
+        if not self._ahead:
+            self._ahead.append(next(self._stream, self._cur))
+        return self._ahead[0]
 
     def _advance(self) -> Token:
-        tok = self._peek()
-        self.pos += 1
+        tok = self._cur
+        if self._ahead:
+            self._cur = self._ahead.pop()
+        else:
+            self._cur = next(self._stream, tok)
         return tok
 
     def _match(self, type_: str, value: Optional[str] = None) -> bool:
@@ -282,7 +387,9 @@ class Parser:
                 continue
             if tok.type == "IDENT" and end_keywords and tok.value in end_keywords:
                 break
-            body.append(self._statement())
+            stmt = self._statement()
+            stmt.line = tok.line
+            body.append(stmt)
         return body
 
     def _statement(self) -> Node:
@@ -295,6 +402,8 @@ class Parser:
                 raise SyntaxError(f"Beklenmeyen '{val}' (satır {tok.line})")
             if val in ("dongu", "döngü"):
                 return self._while_stmt()
+            if val in ("icin", "için"):
+                return self._for_stmt()
             if val == "fonksiyon":
                 return self._func_def()
             if val in ("don", "dön"):
@@ -319,6 +428,8 @@ class Parser:
                 expr = self._expr()
                 return Assign(name, expr)
             expr = self._expr()
+            if isinstance(expr, Index) and self._match("OP", "="):
+                return IndexAssign(expr.target, expr.index, self._expr())
             return ExprStmt(expr)
 
         raise SyntaxError(f"Beklenmeyen token (satır {tok.line})")
@@ -326,7 +437,8 @@ class Parser:
     def _lookahead_is_assign(self) -> bool:
         if self._peek().type != "IDENT":
             return False
-        if self.tokens[self.pos + 1].type == "OP" and self.tokens[self.pos + 1].value == "=":
+        nxt = self._peek_next()
+        if nxt.type == "OP" and nxt.value == "=":
             return True
         return False
 
@@ -365,6 +477,24 @@ class Parser:
             self._advance()
         return While(cond, body)
 
+    def _for_stmt(self) -> For:
+        self._advance()
+        var = self._expect("IDENT").value
+        self._expect("OP", "=")
+        start = self._expr()
+        self._expect("OP", ",")
+        end = self._expr()
+        if self._match("OP", ":"):
+            pass
+        self._expect("NEWLINE")
+        body = self._parse_block({"bitti"})
+        end_tok = self._expect("IDENT")
+        if end_tok.value != "bitti":
+            raise SyntaxError(f"bitti bekleniyordu (satır {end_tok.line})")
+        if self._peek().type == "NEWLINE":
+            self._advance()
+        return For(var, start, end, body)
+
     def _func_def(self) -> FuncDef:
         self._advance()
         name = self._expect("IDENT").value
@@ -444,6 +574,14 @@ class Parser:
         return self._primary()
 
     def _primary(self) -> Node:
+        expr = self._atom()
+        while self._match("OP", "["):
+            index = self._expr()
+            self._expect("OP", "]")
+            expr = Index(expr, index)
+        return expr
+
+    def _atom(self) -> Node:
         tok = self._peek()
         if tok.type == "NUMBER":
             self._advance()
@@ -475,73 +613,262 @@ class Parser:
             expr = self._expr()
             self._expect("OP", ")")
             return expr
+        if self._match("OP", "["):
+            items = []
+            if not self._match("OP", "]"):
+                while True:
+                    items.append(self._expr())
+                    if self._match("OP", ","):
+                        continue
+                    self._expect("OP", "]")
+                    break
+            return ListLiteral(items)
         raise SyntaxError(f"Beklenmeyen ifade (satır {tok.line})")
 
 
-class ReturnSignal(Exception):
-    def __init__(self, value: Any) -> None:
-        self.value = value
+def parse_source(source: str) -> Program:
+    return Parser(Lexer(source).iter_tokens()).parse()
+
+
+_MISSING = object()
+
+
+class VersionedDict(dict):
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if self.get(key, _MISSING) is not value:
+            self.version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Any:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
 
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.version += 1
+        super().update(*args, **kwargs)
 
-class Interpreter:
-    def __init__(self, base_dir: Optional[str] = None) -> None:
+    def clear(self) -> None:
+        self.version += 1
+        super().clear()
+
+
+class CallStats:
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class QuickenStats:
+    __slots__ = ("specialized", "deoptimized", "polymorphic")
+
+    def __init__(self) -> None:
+        self.specialized = 0
+        self.deoptimized = 0
+        self.polymorphic = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "specialized": self.specialized,
+            "deoptimized": self.deoptimized,
+            "polymorphic": self.polymorphic,
+        }
+
+
+# Cagri noktasi onbellegi: hedef (builtin ya da kullanici fonksiyonu) ilk
+# cagrida cozulur ve `functions`/`builtins` surumleri degismedikce yeniden
+# kullanilir. Yeni `fonksiyon` tanimi ya da `dahil` surumu artirir.
+class CallSite:
+    __slots__ = ("name", "norm", "argc", "functions_version", "builtins_version", "builtin", "func")
+
+    def __init__(self, name: str, argc: int) -> None:
+        self.name = name
+        self.norm = _norm_name(name)
+        self.argc = argc
+        self.functions_version = -1
+        self.builtins_version = -1
+        self.builtin: Any = None
+        self.func: Optional[FuncDef] = None
+
+
+class _Normal:
+    def __repr__(self) -> str:
+        return "<normal>"
+
+
+# Bir deyim `don` calistirmadiysa NORMAL doner; aksi halde donus degerini
+# dondurur. Bloklar bu degeri istisna firlatmadan cagirana kadar iletir.
+# Program seviyesindeki `don` programi sonlandirir.
+NORMAL = _Normal()
+
+
+# Tum motorlar `icin` dongusunu Python range'i uzerinden yurutur.
+def counted_range(start: Any, end: Any) -> range:
+    if type(start) is not int or type(end) is not int:
+        raise TypeError("icin sinirlari tam sayi olmali")
+    return range(start, end)
+
+
+# Kapsam kurali: fonksiyon cagrisi yalnizca parametrelerden olusan yerel bir
+# cerceve acar. Okuma once yerel cerceveye, bulunamazsa globallere bakar;
+# fonksiyon icindeki atama her zaman yerel cerceveye yazar, globalleri
+# degistirmez.
+class Interpreter:
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        engine: str = "tree",
+        optimize: bool = False,
+        use_cache: bool = True,
+    ) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"Bilinmeyen motor: {engine}")
         self.globals: Dict[str, Any] = {}
-        self.functions: Dict[str, FuncDef] = {}
-        self.builtins: Dict[str, Any] = {}
+        self.functions: VersionedDict = VersionedDict()
+        self.builtins: VersionedDict = VersionedDict()
+        self.call_stats = CallStats()
+        # Dugum de saklanir; boylece id() baska bir dugum icin yeniden kullanilamaz.
+        self._call_sites: Dict[int, Tuple[Call, CallSite]] = {}
+        self.quicken_stats = QuickenStats()
+        # id -> (dugum, gozlenen tur, ardisik sayisi, toplam gozlem)
+        self._binop_warmup: Dict[int, Tuple[BinOp, Any, int, int]] = {}
+        self._binop_deopts: Dict[int, Tuple[BinOp, int]] = {}
         self.base_dir = base_dir or os.getcwd()
-
-    def run(self, source: str) -> None:
-        tokens = Lexer(source).lex()
-        program = Parser(tokens).parse()
-        self._exec_block(program.body, self.globals)
-
-    def call_function(self, name: str, args: List[Any]) -> Any:
-        if name not in self.functions:
-            raise NameError(f"Bilinmeyen fonksiyon: {name}")
-        func = self.functions[name]
-        if len(args) != len(func.params):
-            raise TypeError(f"{func.name} parametre sayisi uyusmuyor")
-        local_env = dict(self.globals)
-        for p, a in zip(func.params, args):
-            local_env[p] = a
-        try:
-            self._exec_block(func.body, local_env)
-        except ReturnSignal as rs:
-            return rs.value
-        return None
+        self.engine = engine
+        self.optimize = optimize
+        self.use_cache = use_cache
+        self._backend: Any = None
+        # Kullanici modulleri mutlak yola gore: ayristirilmis program ve calistirilmis olanlar.
+        self._module_programs: Dict[str, Program] = {}
+        self._loaded_modules: Set[str] = set()
+
+    def run(self, source: str) -> None:
+        self.run_program(parse_source(source))
+
+    def run_program(self, program: Program) -> None:
+        if self.optimize:
+            from .optimizer import optimize
+
+            program = optimize(program)
+        self._execute(program)
+
+    def _execute(self, program: Program) -> None:
+        if self.engine != "tree":
+            self._engine_backend().run_program(program)
+            return
+        self._exec_block(program.body, self.globals)
+
+    def _engine_backend(self) -> Any:
+        if self._backend is None:
+            if self.engine == "closure":
+                from .closure import ClosureCompiler
+
+                self._backend = ClosureCompiler(self)
+            elif self.engine == "python":
+                from .pycompile import PythonCompiler
+
+                self._backend = PythonCompiler(self)
+            else:
+                from .vm import VM
+
+                self._backend = VM(self)
+        return self._backend
+
+    def call_function(self, name: str, args: List[Any]) -> Any:
+        if name not in self.functions:
+            raise NameError(f"Bilinmeyen fonksiyon: {name}")
+        func = self.functions[name]
+        if self.engine != "tree":
+            return self._engine_backend().call(func, args)
+        if len(args) != len(func.params):
+            raise TypeError(f"{func.name} parametre sayisi uyusmuyor")
+        return self._run_function(func, dict(zip(func.params, args)))
+
+    def _run_function(self, func: FuncDef, local_env: Dict[str, Any]) -> Any:
+        result = self._exec_block(func.body, local_env)
+        return None if result is NORMAL else result
 
     def _exec_block(self, body: List[Node], env: Dict[str, Any]) -> Any:
         for stmt in body:
-            self._exec(stmt, env)
+            result = self._exec(stmt, env)
+            if result is not NORMAL:
+                return result
+        return NORMAL
 
     def _exec(self, node: Node, env: Dict[str, Any]) -> Any:
         if isinstance(node, Assign):
             env[node.name] = self._eval(node.value, env)
-            return None
+            return NORMAL
         if isinstance(node, ExprStmt):
-            return self._eval(node.expr, env)
+            self._eval(node.expr, env)
+            return NORMAL
+        if isinstance(node, IndexAssign):
+            value = self._eval(node.value, env)
+            self._eval(node.target, env)[self._eval(node.index, env)] = value
+            return NORMAL
         if isinstance(node, If):
             if self._eval(node.cond, env):
-                self._exec_block(node.then_body, env)
-            elif node.else_body is not None:
-                self._exec_block(node.else_body, env)
-            return None
+                return self._exec_block(node.then_body, env)
+            if node.else_body is not None:
+                return self._exec_block(node.else_body, env)
+            return NORMAL
         if isinstance(node, While):
             while self._eval(node.cond, env):
-                self._exec_block(node.body, env)
-            return None
+                result = self._exec_block(node.body, env)
+                if result is not NORMAL:
+                    return result
+            return NORMAL
+        if isinstance(node, For):
+            var = node.var
+            for value in counted_range(self._eval(node.start, env), self._eval(node.end, env)):
+                env[var] = value
+                result = self._exec_block(node.body, env)
+                if result is not NORMAL:
+                    return result
+            return NORMAL
         if isinstance(node, FuncDef):
             self.functions[node.name] = node
-            return None
+            return NORMAL
         if isinstance(node, Return):
-            value = self._eval(node.value, env) if node.value else None
-            raise ReturnSignal(value)
+            return self._eval(node.value, env) if node.value else None
         if isinstance(node, Import):
             self._import_module(node.name, env)
-            return None
+            return NORMAL
         raise RuntimeError("Bilinmeyen ifade")
 
     def _eval(self, node: Node, env: Dict[str, Any]) -> Any:
+        cls = node.__class__
+        if cls is IntBinOp or cls is FloatBinOp:
+            left = self._eval(node.left, env)
+            right = self._eval(node.right, env)
+            kind = cls.kind
+            if type(left) is not kind or type(right) is not kind:
+                self._deoptimize(node)
+            # QUICK_OPS genel yoldaki operatorlerle ayni anlama sahip.
+            return QUICK_OPS[node.op](left, right)
         if isinstance(node, Number):
             return node.value
         if isinstance(node, String):
@@ -551,6 +878,8 @@ class Interpreter:
         if isinstance(node, Var):
             if node.name in env:
                 return env[node.name]
+            if node.name in self.globals:
+                return self.globals[node.name]
             raise NameError(f"Tanımsız değişken: {node.name}")
         if isinstance(node, UnaryOp):
             val = self._eval(node.expr, env)
@@ -563,6 +892,8 @@ class Interpreter:
         if isinstance(node, BinOp):
             left = self._eval(node.left, env)
             right = self._eval(node.right, env)
+            if node.quicken:
+                self._observe(node, left, right)
             op = node.op
             if op == "+":
                 return left + right
@@ -592,47 +923,149 @@ class Interpreter:
                 return bool(left) or bool(right)
         if isinstance(node, Call):
             return self._call(node, env)
+        if isinstance(node, Index):
+            return self._eval(node.target, env)[self._eval(node.index, env)]
+        if isinstance(node, ListLiteral):
+            return [self._eval(item, env) for item in node.items]
         raise RuntimeError("Bilinmeyen ifade")
 
-    def _call(self, node: Call, env: Dict[str, Any]) -> Any:
-        norm = _norm_name(node.name)
-        if norm == "yazdir":
-            args = [self._eval(a, env) for a in node.args]
-            print(*args)
-            return None
-        if norm in self.builtins:
-            args = [self._eval(a, env) for a in node.args]
-            return self.builtins[norm](*args)
-        if node.name in self.functions:
-            func = self.functions[node.name]
-            if len(node.args) != len(func.params):
+    def _observe(self, node: BinOp, left: Any, right: Any) -> None:
+        key = id(node)
+        entry = self._binop_warmup.get(key)
+        kind = type(left)
+        if kind is not type(right) or (kind is not int and kind is not float):
+            kind = None
+        if entry is None or entry[0] is not node:
+            if node.op not in QUICK_OPS:
+                # ve/veya: hizlandirilacak bir yol yok, sayilmaz.
+                node.__class__ = PolyBinOp
+                return
+            entry = (node, kind, 0, 0)
+        _, seen_kind, streak, seen = entry
+        streak = streak + 1 if kind is not None and kind is seen_kind else (1 if kind is not None else 0)
+        seen += 1
+        # tasync gorevleri ayni dugumu ayni anda gozlemleyebilir; silme iki kez yapilabilir.
+        if streak >= QUICKEN_AFTER:
+            self._binop_warmup.pop(key, None)
+            node.__class__ = IntBinOp if kind is int else FloatBinOp
+            self.quicken_stats.specialized += 1
+        elif seen >= QUICKEN_GIVE_UP:
+            self._binop_warmup.pop(key, None)
+            self._make_polymorphic(node)
+        else:
+            self._binop_warmup[key] = (node, kind, streak, seen)
+
+    def _deoptimize(self, node: BinOp) -> None:
+        self.quicken_stats.deoptimized += 1
+        key = id(node)
+        entry = self._binop_deopts.get(key)
+        count = 1 if entry is None or entry[0] is not node else entry[1] + 1
+        if count >= MAX_DEOPTS:
+            self._binop_deopts.pop(key, None)
+            self._make_polymorphic(node)
+            return
+        self._binop_deopts[key] = (node, count)
+        node.__class__ = BinOp
+
+    def _make_polymorphic(self, node: BinOp) -> None:
+        node.__class__ = PolyBinOp
+        self.quicken_stats.polymorphic += 1
+
+    def resolve_call_site(self, site: CallSite) -> None:
+        self.call_stats.misses += 1
+        builtin = print if site.norm == "yazdir" else self.builtins.get(site.norm)
+        func = None
+        if builtin is None:
+            func = self.functions.get(site.name)
+            if func is None:
+                raise NameError(f"Bilinmeyen fonksiyon: {site.name}")
+            if site.argc != len(func.params):
                 raise TypeError(f"{func.name} parametre sayisi uyusmuyor")
-            local_env = dict(self.globals)
-            for p, a in zip(func.params, node.args):
-                local_env[p] = self._eval(a, env)
-            try:
-                self._exec_block(func.body, local_env)
-            except ReturnSignal as rs:
-                return rs.value
-            return None
-        raise NameError(f"Bilinmeyen fonksiyon: {node.name}")
+        site.builtin = builtin
+        site.func = func
+        site.functions_version = self.functions.version
+        site.builtins_version = self.builtins.version
+
+    def _call(self, node: Call, env: Dict[str, Any]) -> Any:
+        entry = self._call_sites.get(id(node))
+        if entry is None:
+            site = CallSite(node.name, len(node.args))
+            self._call_sites[id(node)] = (node, site)
+        else:
+            site = entry[1]
+        if (
+            site.functions_version != self.functions.version
+            or site.builtins_version != self.builtins.version
+        ):
+            self.resolve_call_site(site)
+        else:
+            self.call_stats.hits += 1
+        if site.builtin is not None:
+            return site.builtin(*[self._eval(a, env) for a in node.args])
+        func = site.func
+        return self._run_function(func, {p: self._eval(a, env) for p, a in zip(func.params, node.args)})
+
+    def _module_path(self, name: str) -> str:
+        fname = name if name.endswith(".tay") else name + ".tay"
+        return os.path.abspath(os.path.join(self.base_dir, fname))
+
+    def load_module(self, name: str) -> Optional[Program]:
+        # `dahil "utils"` -> base_dir/utils.tay; ayristirma diskte icerik ozetine gore onbelleklenir.
+        path = self._module_path(name)
+        program = self._module_programs.get(path)
+        if program is None:
+            if not os.path.isfile(path):
+                return None
+            from .cache import load_program
+
+            with open(path, "r", encoding="utf-8-sig") as f:
+                source = f.read()
+            program = load_program(path, source, use_cache=self.use_cache)
+            self._module_programs[path] = program
+        return program
+
+    def _run_module(self, path: str, program: Program) -> None:
+        if self.optimize:
+            from .optimizer import optimize
+
+            program = optimize(program, shared_globals=True)
+        self._execute(program)
 
     def _import_module(self, name: str, env: Dict[str, Any]) -> None:
         if name in STDLIB_MODULES:
             mod = importlib.import_module(STDLIB_MODULES[name])
             if hasattr(mod, "__all__"):
                 for fname in mod.__all__:
-                    self.builtins[_norm_name(fname)] = getattr(mod, fname)
+                    fn = getattr(mod, fname)
+                    # Programin fonksiyonlarina erisen builtinler yorumlayiciyi ilk arguman olarak alir.
+                    if getattr(fn, "taylan_interp", False):
+                        fn = functools.partial(fn, self)
+                    self.builtins[_norm_name(fname)] = fn
             env[name] = {
                 "name": name,
                 "builtin": True,
             }
             return
 
+        program = self.load_module(name)
+        if program is not None:
+            path = self._module_path(name)
+            if path not in self._loaded_modules:
+                # Calistirmadan once isaretlenir; dongusel `dahil` modulu ikinci kez calistirmaz.
+                self._loaded_modules.add(path)
+                self._run_module(path, program)
+            env[name] = {
+                "name": name,
+                "source": path,
+            }
+            return
+
         packages_dir = os.path.join(self.base_dir, "taylan_packages")
         registry_file = os.path.join(packages_dir, "registry.json")
         if not os.path.exists(registry_file):
-            raise FileNotFoundError("Paket kaydi yok. Once kurulum yap.")
+            raise FileNotFoundError(
+                f"Modul bulunamadi: {name} ({self._module_path(name)} yok, paket kaydi da yok. Once kurulum yap.)"
+            )
         with open(registry_file, "r", encoding="utf-8") as f:
             reg = json.load(f)
         if name not in reg:
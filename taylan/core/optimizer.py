@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .interpreter import (
+    STDLIB_MODULES,
+    Assign,
+    BinOp,
+    Bool,
+    Call,
+    ExprStmt,
+    For,
+    FuncDef,
+    If,
+    Import,
+    Index,
+    IndexAssign,
+    ListLiteral,
+    Node,
+    Number,
+    Program,
+    Return,
+    String,
+    UnaryOp,
+    Var,
+    While,
+    parse_source,
+)
+from .unparser import is_literal_value, unparse
+
+CONSTANT_NODES = (Number, String, Bool)
+
+# Katlanan sabitlerin AST'yi ve onbellek dosyalarini sisirmemesi icin sinirlar.
+MAX_FOLDED_STR = 4096
+MAX_FOLDED_INT_BITS = 128
+
+# Agac yorumlayicisiyla ayni anlam: `ve`/`veya` iki tarafi da degerlendirir.
+FOLD_BINARY: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b,
+    "%": lambda a, b: a % b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b,
+    ">=": lambda a, b: a >= b,
+    "ve": lambda a, b: bool(a) and bool(b),
+    "veya": lambda a, b: bool(a) or bool(b),
+}
+
+FOLD_UNARY: Dict[str, Callable[[Any], Any]] = {
+    "-": lambda a: -a,
+    "+": lambda a: +a,
+    "degil": lambda a: not bool(a),
+}
+
+# Sayisal tur cikarimi: x * 1 gibi sadelestirmeler yalnizca x'in kesinlikle
+# int/float oldugu kanitlanabildiginde yapilir ("abc" + 0 hata vermelidir,
+# dogru * 1 ise 1 olur).
+INT = "int"
+FLOAT = "float"
+NUM = "num"
+_PENDING = "pending"
+
+Kind = Optional[str]
+
+
+def _join(a: Kind, b: Kind) -> Kind:
+    if a == _PENDING:
+        return b
+    if b == _PENDING:
+        return a
+    if a is None or b is None:
+        return None
+    if a == b:
+        return a
+    return NUM
+
+
+def _arith_kind(op: str, a: Kind, b: Kind) -> Kind:
+    if a is None or b is None:
+        return None
+    if a == _PENDING:
+        a = b
+    if b == _PENDING:
+        b = a
+    if a == _PENDING:
+        return _PENDING
+    if op == "/":
+        return FLOAT
+    if a == INT and b == INT:
+        return INT
+    if a == FLOAT or b == FLOAT:
+        return FLOAT
+    return NUM
+
+
+def _expr_kind(node: Node, kinds: Dict[str, Kind]) -> Kind:
+    if isinstance(node, Number):
+        return INT if isinstance(node.value, int) else FLOAT
+    if isinstance(node, Var):
+        return kinds.get(node.name)
+    if isinstance(node, UnaryOp) and node.op in ("-", "+"):
+        return _expr_kind(node.expr, kinds)
+    if isinstance(node, BinOp) and node.op in ("+", "-", "*", "/", "%"):
+        return _arith_kind(node.op, _expr_kind(node.left, kinds), _expr_kind(node.right, kinds))
+    return None
+
+
+def _collect_assigns(body: List[Node], out: List[Tuple[str, Optional[Node]]]) -> None:
+    for node in body:
+        if isinstance(node, Assign):
+            out.append((node.name, node.value))
+        elif isinstance(node, Import):
+            out.append((node.name, None))
+        elif isinstance(node, If):
+            _collect_assigns(node.then_body, out)
+            if node.else_body is not None:
+                _collect_assigns(node.else_body, out)
+        elif isinstance(node, While):
+            _collect_assigns(node.body, out)
+        elif isinstance(node, For):
+            # Dongu degiskeni her zaman int'tir (counted_range).
+            out.append((node.var, Number(0)))
+            _collect_assigns(node.body, out)
+
+
+def _has_user_import(body: List[Node]) -> bool:
+    for node in body:
+        if isinstance(node, Import):
+            if node.name not in STDLIB_MODULES:
+                return True
+        elif isinstance(node, If):
+            if _has_user_import(node.then_body):
+                return True
+            if node.else_body is not None and _has_user_import(node.else_body):
+                return True
+        elif isinstance(node, (While, For, FuncDef)):
+            if _has_user_import(node.body):
+                return True
+    return False
+
+
+def _infer_kinds(
+    assigns: List[Tuple[str, Optional[Node]]],
+    outer: Dict[str, Kind],
+    unknown: Set[str],
+) -> Dict[str, Kind]:
+    names = {name for name, _ in assigns} - unknown
+    kinds: Dict[str, Kind] = dict(outer)
+    for name in unknown:
+        kinds[name] = None
+    for name in names:
+        # Fonksiyon icinde atanmadan okunan yerel ad globale duser.
+        kinds[name] = outer.get(name, _PENDING)
+    changed = True
+    while changed:
+        changed = False
+        for name, value in assigns:
+            if name not in names:
+                continue
+            kind = None if value is None else _expr_kind(value, kinds)
+            joined = _join(kinds[name], kind)
+            if joined != kinds[name]:
+                kinds[name] = joined
+                changed = True
+    for name in names:
+        if kinds[name] == _PENDING:
+            kinds[name] = None
+    return kinds
+
+
+def _foldable(value: Any) -> Optional[Node]:
+    if isinstance(value, bool):
+        return Bool(value)
+    if isinstance(value, int):
+        if value.bit_length() > MAX_FOLDED_INT_BITS:
+            return None
+        return Number(value)
+    if isinstance(value, float):
+        return Number(value) if is_literal_value(value) else None
+    if isinstance(value, str):
+        if len(value) > MAX_FOLDED_STR or not is_literal_value(value):
+            return None
+        return String(value)
+    return None
+
+
+def _is_int(node: Node, value: int) -> bool:
+    return isinstance(node, Number) and type(node.value) is int and node.value == value
+
+
+def _is_int_const(node: Node) -> bool:
+    return isinstance(node, Number) and type(node.value) is int
+
+
+def _always_returns(body: List[Node]) -> bool:
+    if not body:
+        return False
+    last = body[-1]
+    if isinstance(last, Return):
+        return True
+    if isinstance(last, If) and last.else_body is not None:
+        return _always_returns(last.then_body) and _always_returns(last.else_body)
+    return False
+
+
+# Program bir butun olarak ele alinir: global turler yalnizca programdaki
+# atamalardan cikarilir, yani program taze bir Interpreter'da calistirilmalidir.
+# Kullanici modulu dahil eden (ya da dahil edilen) programlarda globaller baska
+# dosyalarca da atanabilir; bu durumda global turleri bilinmez sayilir.
+class Optimizer:
+    def __init__(self, shared_globals: bool = False) -> None:
+        self.shared_globals = shared_globals
+        self.folded = 0
+        self.simplified = 0
+        self.removed = 0
+        self._kinds: Dict[str, Kind] = {}
+        self._globals: Dict[str, Kind] = {}
+
+    def optimize(self, program: Program) -> Program:
+        assigns: List[Tuple[str, Optional[Node]]] = []
+        _collect_assigns(program.body, assigns)
+        unknown: Set[str] = set()
+        if self.shared_globals or _has_user_import(program.body):
+            unknown = {name for name, _ in assigns}
+        self._globals = _infer_kinds(assigns, {}, unknown)
+        self._kinds = self._globals
+        return replace(program, body=self._block(program.body))
+
+    def _block(self, body: List[Node]) -> List[Node]:
+        out: List[Node] = []
+        for i, node in enumerate(body):
+            out.extend(self._stmt(node))
+            if _always_returns(out):
+                self.removed += len(body) - i - 1
+                break
+        return out
+
+    def _stmt(self, node: Node) -> List[Node]:
+        if isinstance(node, Assign):
+            return [replace(node, value=self._expr(node.value))]
+        if isinstance(node, ExprStmt):
+            expr = self._expr(node.expr)
+            if isinstance(expr, CONSTANT_NODES):
+                self.removed += 1
+                return []
+            return [replace(node, expr=expr)]
+        if isinstance(node, IndexAssign):
+            return [
+                replace(
+                    node,
+                    target=self._expr(node.target),
+                    index=self._expr(node.index),
+                    value=self._expr(node.value),
+                )
+            ]
+        if isinstance(node, Return):
+            if not node.value:
+                return [node]
+            return [replace(node, value=self._expr(node.value))]
+        if isinstance(node, If):
+            return self._if(node)
+        if isinstance(node, While):
+            cond = self._expr(node.cond)
+            if isinstance(cond, CONSTANT_NODES) and not cond.value:
+                self.removed += 1
+                return []
+            return [replace(node, cond=cond, body=self._block(node.body))]
+        if isinstance(node, For):
+            start = self._expr(node.start)
+            end = self._expr(node.end)
+            if _is_int_const(start) and _is_int_const(end) and start.value >= end.value:
+                self.removed += 1
+                return []
+            return [replace(node, start=start, end=end, body=self._block(node.body))]
+        if isinstance(node, FuncDef):
+            return [self._func_def(node)]
+        return [node]
+
+    def _if(self, node: If) -> List[Node]:
+        cond = self._expr(node.cond)
+        if isinstance(cond, CONSTANT_NODES):
+            self.removed += 1
+            if cond.value:
+                return self._block(node.then_body)
+            if node.else_body is not None:
+                return self._block(node.else_body)
+            return []
+        then_body = self._block(node.then_body)
+        else_body = None if node.else_body is None else self._block(node.else_body) or None
+        if not then_body:
+            if else_body is None:
+                return [ExprStmt(cond, line=node.line)]
+            return [replace(node, cond=UnaryOp("degil", cond), then_body=else_body, else_body=None)]
+        return [replace(node, cond=cond, then_body=then_body, else_body=else_body)]
+
+    def _func_def(self, node: FuncDef) -> FuncDef:
+        assigns: List[Tuple[str, Optional[Node]]] = []
+        _collect_assigns(node.body, assigns)
+        outer = self._kinds
+        self._kinds = _infer_kinds(assigns, self._globals, set(node.params))
+        try:
+            return replace(node, body=self._block(node.body))
+        finally:
+            self._kinds = outer
+
+    def _expr(self, node: Node) -> Node:
+        if isinstance(node, UnaryOp):
+            expr = self._expr(node.expr)
+            if isinstance(expr, CONSTANT_NODES) and node.op in FOLD_UNARY:
+                folded = self._fold(FOLD_UNARY[node.op], expr.value)
+                if folded is not None:
+                    return folded
+            return replace(node, expr=expr)
+        if isinstance(node, BinOp):
+            left = self._expr(node.left)
+            right = self._expr(node.right)
+            if isinstance(left, CONSTANT_NODES) and isinstance(right, CONSTANT_NODES) and node.op in FOLD_BINARY:
+                folded = self._fold(FOLD_BINARY[node.op], left.value, right.value)
+                if folded is not None:
+                    return folded
+            simple = self._simplify(node.op, left, right)
+            if simple is not None:
+                self.simplified += 1
+                return simple
+            return replace(node, left=left, right=right)
+        if isinstance(node, Call):
+            return replace(node, args=[self._expr(a) for a in node.args])
+        if isinstance(node, ListLiteral):
+            return replace(node, items=[self._expr(i) for i in node.items])
+        if isinstance(node, Index):
+            return replace(node, target=self._expr(node.target), index=self._expr(node.index))
+        return node
+
+    def _fold(self, fn: Callable[..., Any], *args: Any) -> Optional[Node]:
+        try:
+            value = fn(*args)
+        except Exception:
+            return None
+        folded = _foldable(value)
+        if folded is not None:
+            self.folded += 1
+        return folded
+
+    def _simplify(self, op: str, left: Node, right: Node) -> Optional[Node]:
+        if op == "*":
+            if _is_int(right, 1) and _expr_kind(left, self._kinds) in (INT, FLOAT, NUM):
+                return left
+            if _is_int(left, 1) and _expr_kind(right, self._kinds) in (INT, FLOAT, NUM):
+                return right
+        elif op == "+":
+            # float icin x + 0 ayni degil: -0.0 + 0 == 0.0
+            if _is_int(right, 0) and _expr_kind(left, self._kinds) == INT:
+                return left
+            if _is_int(left, 0) and _expr_kind(right, self._kinds) == INT:
+                return right
+        elif op == "-":
+            if _is_int(right, 0) and _expr_kind(left, self._kinds) in (INT, FLOAT, NUM):
+                return left
+        elif op == "/":
+            if _is_int(right, 1) and _expr_kind(left, self._kinds) == FLOAT:
+                return left
+        return None
+
+
+def optimize(program: Program, shared_globals: bool = False) -> Program:
+    return Optimizer(shared_globals).optimize(program)
+
+
+def optimize_source(source: str) -> str:
+    return unparse(optimize(parse_source(source)))
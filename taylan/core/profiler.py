@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import os
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .interpreter import FuncDef, Interpreter, Node, Program
+
+MODULE = "<modul>"
+MAIN_FILE = "<ana>"
+
+
+class Stat:
+    __slots__ = ("calls", "cumulative", "self_time", "depth")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cumulative = 0
+        self.self_time = 0
+        self.depth = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "cumulative_ms": self.cumulative / 1e6,
+            "self_ms": self.self_time / 1e6,
+        }
+
+
+# Her kayit icin iki zaman tutulur: kumulatif (cocuklar dahil) ve oz zaman.
+# Oz zaman, `_children` yiginindaki birikimden hesaplanir: bir fonksiyonun oz
+# zamanina cagirdigi fonksiyonlar ve builtinler, bir satirin oz zamanina ise
+# ic bloklar ve cagrilan kullanici fonksiyonlarinin satirlari dahil edilmez.
+# Satirlar (dosya, satir) ile anahtarlanir: `dahil` edilen modullerin satirlari
+# ana dosyadaki ayni numarali satirla karismaz.
+class ProfilingInterpreter(Interpreter):
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        optimize: bool = False,
+        use_cache: bool = True,
+        path: Optional[str] = None,
+    ) -> None:
+        super().__init__(base_dir=base_dir, engine="tree", optimize=optimize, use_cache=use_cache)
+        self.main_path = os.path.abspath(path) if path else MAIN_FILE
+        self.functions_stats: Dict[str, Stat] = {MODULE: Stat()}
+        self.line_stats: Dict[Tuple[str, int], Stat] = {}
+        self.builtin_stats: Dict[str, Stat] = {}
+        self.total_ns = 0
+        self._func_children: List[int] = [0]
+        self._line_children: List[int] = [0]
+        self._wrapped: Dict[str, Callable[..., Any]] = {}
+        # Calisan kodun dosyasi; fonksiyonlar tanimlandiklari dosyada sayilir.
+        self._files: List[str] = [self.main_path]
+        self._func_files: Dict[int, Tuple[FuncDef, str]] = {}
+
+    def run_program(self, program: Any) -> None:
+        stat = self.functions_stats[MODULE]
+        stat.calls += 1
+        start = perf_counter_ns()
+        try:
+            super().run_program(program)
+        finally:
+            elapsed = perf_counter_ns() - start
+            self.total_ns += elapsed
+            stat.cumulative += elapsed
+            stat.self_time += elapsed - self._func_children[0]
+            self._func_children[0] = 0
+
+    def _run_module(self, path: str, program: Program) -> None:
+        self._files.append(path)
+        try:
+            super()._run_module(path, program)
+        finally:
+            self._files.pop()
+
+    def _exec(self, node: Node, env: Dict[str, Any]) -> Any:
+        key = (self._files[-1], node.line)
+        stat = self.line_stats.get(key)
+        if stat is None:
+            stat = self.line_stats[key] = Stat()
+        if isinstance(node, FuncDef):
+            self._func_files[id(node)] = (node, key[0])
+        children = self._line_children
+        children.append(0)
+        stat.calls += 1
+        stat.depth += 1
+        start = perf_counter_ns()
+        try:
+            return super()._exec(node, env)
+        finally:
+            elapsed = perf_counter_ns() - start
+            stat.depth -= 1
+            stat.self_time += elapsed - children.pop()
+            if stat.depth == 0:
+                stat.cumulative += elapsed
+            children[-1] += elapsed
+
+    def _run_function(self, func: FuncDef, local_env: Dict[str, Any]) -> Any:
+        stat = self.functions_stats.get(func.name)
+        if stat is None:
+            stat = self.functions_stats[func.name] = Stat()
+        defined = self._func_files.get(id(func))
+        self._files.append(defined[1] if defined is not None and defined[0] is func else self._files[-1])
+        children = self._func_children
+        children.append(0)
+        stat.calls += 1
+        stat.depth += 1
+        start = perf_counter_ns()
+        try:
+            return super()._run_function(func, local_env)
+        finally:
+            self._files.pop()
+            elapsed = perf_counter_ns() - start
+            stat.depth -= 1
+            stat.self_time += elapsed - children.pop()
+            # Ozyinelemede kumulatif sure yalnizca en distaki cagrida eklenir.
+            if stat.depth == 0:
+                stat.cumulative += elapsed
+            children[-1] += elapsed
+
+    def _import_module(self, name: str, env: Dict[str, Any]) -> None:
+        super()._import_module(name, env)
+        for bname, fn in list(self.builtins.items()):
+            if self._wrapped.get(bname) is not fn:
+                wrapped = self._wrap_builtin(bname, fn)
+                self._wrapped[bname] = wrapped
+                self.builtins[bname] = wrapped
+
+    def _wrap_builtin(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        stat = self.builtin_stats.setdefault(name, Stat())
+        children = self._func_children
+
+        def timed(*args: Any) -> Any:
+            stat.calls += 1
+            start = perf_counter_ns()
+            try:
+                return fn(*args)
+            finally:
+                elapsed = perf_counter_ns() - start
+                stat.cumulative += elapsed
+                stat.self_time += elapsed
+                children[-1] += elapsed
+
+        return timed
+
+    def report(self, source_lines: Optional[List[str]] = None) -> Dict[str, Any]:
+        def rows(stats: Dict[Any, Stat], key: str) -> List[Dict[str, Any]]:
+            out = []
+            for name, stat in stats.items():
+                if stat.calls:
+                    row = {key: name}
+                    row.update(stat.as_dict())
+                    out.append(row)
+            out.sort(key=lambda r: r["self_ms"], reverse=True)
+            return out
+
+        sources: Dict[str, Optional[List[str]]] = {self.main_path: source_lines}
+        lines = []
+        for row in rows(self.line_stats, "line"):
+            path, line = row["line"]
+            row["file"] = self._display_path(path)
+            row["line"] = line
+            row["location"] = f"{row['file']}:{line}"
+            if path not in sources:
+                sources[path] = self._read_lines(path)
+            text = sources[path]
+            if text is not None:
+                row["source"] = text[line - 1].strip() if 0 < line <= len(text) else ""
+            lines.append(row)
+        return {
+            "total_ms": self.total_ns / 1e6,
+            "functions": rows(self.functions_stats, "name"),
+            "builtins": rows(self.builtin_stats, "name"),
+            "lines": lines,
+        }
+
+    def _display_path(self, path: str) -> str:
+        if path == MAIN_FILE:
+            return path
+        try:
+            rel = os.path.relpath(path, self.base_dir)
+        except ValueError:
+            return path
+        return path if rel.startswith("..") else rel
+
+    @staticmethod
+    def _read_lines(path: str) -> Optional[List[str]]:
+        try:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                return f.read().splitlines()
+        except OSError:
+            return None
+
+
+def _table(title: str, rows: List[Dict[str, Any]], key: str, limit: int) -> List[str]:
+    out = [title]
+    if not rows:
+        out.append("  (kayit yok)")
+        return out
+    width = max(len(str(r[key])) for r in rows[:limit])
+    width = max(width, len(key))
+    out.append(f"  {key:<{width}}  {'cagri':>10}  {'kumulatif ms':>12}  {'oz ms':>10}")
+    for r in rows[:limit]:
+        label = str(r[key])
+        out.append(
+            f"  {label:<{width}}  {r['calls']:>10}  {r['cumulative_ms']:>12.3f}  {r['self_ms']:>10.3f}"
+            + (f"  {r['source']}" if "source" in r else "")
+        )
+    if len(rows) > limit:
+        out.append(f"  ... {len(rows) - limit} satir daha")
+    return out
+
+
+def format_report(report: Dict[str, Any], limit: int = 20) -> str:
+    out = [f"Toplam sure: {report['total_ms']:.3f} ms", ""]
+    out.extend(_table("Fonksiyonlar:", report["functions"], "name", limit))
+    out.append("")
+    out.extend(_table("Builtinler:", report["builtins"], "name", limit))
+    out.append("")
+    out.extend(_table("Satirlar:", report["lines"], "location", limit))
+    return "\n".join(out)
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import ast
+import builtins
+import functools
+import types
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .interpreter import (
+    Assign,
+    BinOp,
+    Bool,
+    Call,
+    CallSite,
+    ExprStmt,
+    For,
+    FuncDef,
+    If,
+    Import,
+    Index,
+    IndexAssign,
+    ListLiteral,
+    Node,
+    Number,
+    Program,
+    Return,
+    String,
+    UnaryOp,
+    Var,
+    While,
+    _norm_name,
+    counted_range,
+)
+from .resolver import UNBOUND, function_layout, resolve
+
+PREFIX = "__taylan_"
+FILENAME = "<taylan>"
+
+# Taylan'da bu adlar tanimsizsa NameError vermeli; Python builtins'ine dusmemeli.
+PYTHON_BUILTIN_NAMES = frozenset(dir(builtins))
+
+BINARY_AST = {
+    "+": ast.Add,
+    "-": ast.Sub,
+    "*": ast.Mult,
+    "/": ast.Div,
+    "%": ast.Mod,
+}
+
+COMPARE_AST = {
+    "==": ast.Eq,
+    "!=": ast.NotEq,
+    "<": ast.Lt,
+    ">": ast.Gt,
+    "<=": ast.LtE,
+    ">=": ast.GtE,
+}
+
+UNARY_AST = {
+    "-": ast.USub,
+    "+": ast.UAdd,
+    "degil": ast.Not,
+}
+
+HELPERS = ("T", "U", "load", "define", "import_", "print", "range")
+
+
+class _CannotLower(Exception):
+    pass
+
+
+def _helper(name: str) -> ast.Name:
+    return ast.Name(PREFIX + name, ast.Load())
+
+
+def _check_name(name: str) -> str:
+    if name.startswith(PREFIX) or name in ("None", "True", "False", "__debug__"):
+        raise _CannotLower(name)
+    return name
+
+
+def _translate_name_error(e: NameError) -> Optional[NameError]:
+    name = getattr(e, "name", None)
+    if name and str(e) == f"name '{name}' is not defined":
+        return NameError(f"Tanımsız değişken: {name}")
+    return None
+
+
+# Taylan AST'si Python ast.Module'une indirilir ve tek seferde compile()
+# edilir. Fonksiyon cagrilari `T["ad/argc"]` tablosundan cozulur; tablo
+# `functions`/`builtins` surumu degisince bosaltilir. Indirilemeyen programlar
+# agac yorumlayicisiyla calistirilir.
+class _Lowering:
+    def __init__(self, compiler: "PythonCompiler") -> None:
+        self.compiler = compiler
+        self.funcs: List[FuncDef] = []
+        self.func_defs: List[ast.stmt] = []
+        self._locals: Optional[Set[str]] = None
+        self._defined: Set[str] = set()
+        self._checked: Set[str] = set()
+
+    def lower_program(self, program: Program) -> ast.Module:
+        global_names: Set[str] = set()
+        _collect_targets(program.body, global_names)
+        body: List[ast.stmt] = []
+        if global_names:
+            body.append(ast.Global(sorted(_check_name(n) for n in global_names)))
+        body.extend(self._block(program.body))
+        main = ast.FunctionDef(
+            PREFIX + "main",
+            _arguments([]),
+            body or [ast.Pass()],
+            [],
+            None,
+        )
+        names = ast.Tuple([ast.Name(f"{PREFIX}f{i}", ast.Load()) for i in range(len(self.funcs))], ast.Load())
+        factory = ast.FunctionDef(
+            PREFIX + "factory",
+            _arguments([PREFIX + h for h in HELPERS]),
+            self.func_defs + [main, ast.Return(ast.Tuple([_helper("main"), names], ast.Load()))],
+            [],
+            None,
+        )
+        return ast.fix_missing_locations(ast.Module([factory], []))
+
+    def _function(self, node: FuncDef) -> int:
+        index = len(self.funcs)
+        self.funcs.append(node)
+        layout = function_layout(node)
+        outer = (self._locals, self._defined, self._checked)
+        self._locals = set(layout.varnames)
+        self._defined = set(node.params)
+        self._checked = set()
+        try:
+            body = self._block(node.body)
+            init: List[ast.stmt] = [
+                ast.Assign([ast.Name(_check_name(n), ast.Store())], _helper("U"))
+                for n in layout.varnames
+                if n in self._checked and n not in node.params
+            ]
+            params = [_check_name(p) for p in node.params]
+        finally:
+            self._locals, self._defined, self._checked = outer
+        func = ast.FunctionDef(f"{PREFIX}f{index}", _arguments(params), init + body or [ast.Pass()], [], None)
+        func.lineno = func.end_lineno = node.line or 1
+        self.func_defs.append(func)
+        return index
+
+    def _block(self, body: List[Node]) -> List[ast.stmt]:
+        out: List[ast.stmt] = []
+        for node in body:
+            stmt = self._stmt(node)
+            stmt.lineno = stmt.end_lineno = node.line or 1
+            stmt.col_offset = stmt.end_col_offset = 0
+            out.append(stmt)
+        return out
+
+    def _branch(self, body: List[Node]) -> Tuple[List[ast.stmt], Set[str]]:
+        before = self._defined
+        self._defined = set(before)
+        try:
+            return self._block(body) or [ast.Pass()], self._defined
+        finally:
+            self._defined = before
+
+    def _stmt(self, node: Node) -> ast.stmt:
+        if isinstance(node, Assign):
+            value = self._expr(node.value)
+            self._defined.add(node.name)
+            return ast.Assign([ast.Name(_check_name(node.name), ast.Store())], value)
+        if isinstance(node, ExprStmt):
+            return ast.Expr(self._expr(node.expr))
+        if isinstance(node, IndexAssign):
+            # Python da once degeri, sonra hedefi ve indeksi degerlendirir.
+            value = self._expr(node.value)
+            target = ast.Subscript(self._expr(node.target), self._expr(node.index), ast.Store())
+            return ast.Assign([target], value)
+        if isinstance(node, If):
+            test = self._expr(node.cond)
+            then_body, then_defined = self._branch(node.then_body)
+            if node.else_body is None:
+                return ast.If(test, then_body, [])
+            else_body, else_defined = self._branch(node.else_body)
+            self._defined |= then_defined & else_defined
+            return ast.If(test, then_body, else_body)
+        if isinstance(node, While):
+            test = self._expr(node.cond)
+            body, _ = self._branch(node.body)
+            return ast.While(test, body, [])
+        if isinstance(node, For):
+            bounds = [self._expr(node.start), self._expr(node.end)]
+            before = self._defined
+            self._defined = before | {node.var}
+            try:
+                body = self._block(node.body) or [ast.Pass()]
+            finally:
+                # Sifir turlu dongu degiskeni atamaz.
+                self._defined = before
+            target = ast.Name(_check_name(node.var), ast.Store())
+            return ast.For(target, ast.Call(_helper("range"), bounds, []), body, [])
+        if isinstance(node, FuncDef):
+            index = self._function(node)
+            return ast.Expr(ast.Call(_helper("define"), [ast.Constant(index)], []))
+        if isinstance(node, Return):
+            value = self._expr(node.value) if node.value else ast.Constant(None)
+            return ast.Return(value)
+        if isinstance(node, Import):
+            self._defined.add(node.name)
+            call = ast.Call(_helper("import_"), [ast.Constant(node.name)], [])
+            return ast.Assign([ast.Name(_check_name(node.name), ast.Store())], call)
+        raise _CannotLower(type(node).__name__)
+
+    def _expr(self, node: Node) -> ast.expr:
+        if isinstance(node, (Number, String, Bool)):
+            return ast.Constant(node.value)
+        if isinstance(node, Var):
+            return self._load(node.name)
+        if isinstance(node, UnaryOp):
+            op = UNARY_AST.get(node.op)
+            if op is None:
+                raise _CannotLower(node.op)
+            return ast.UnaryOp(op(), self._expr(node.expr))
+        if isinstance(node, BinOp):
+            left = self._expr(node.left)
+            right = self._expr(node.right)
+            if node.op in BINARY_AST:
+                return ast.BinOp(left, BINARY_AST[node.op](), right)
+            if node.op in COMPARE_AST:
+                return ast.Compare(left, [COMPARE_AST[node.op]()], [right])
+            if node.op in ("ve", "veya"):
+                # Iki taraf da degerlendirilir ve sonuc bool olur: (not not a) & (not not b)
+                op = ast.BitAnd() if node.op == "ve" else ast.BitOr()
+                return ast.BinOp(_truth(left), op, _truth(right))
+            raise _CannotLower(node.op)
+        if isinstance(node, Call):
+            args = [self._expr(a) for a in node.args]
+            if _norm_name(node.name) == "yazdir":
+                return ast.Call(_helper("print"), args, [])
+            key = self.compiler.site_key(node.name, len(args))
+            target = ast.Subscript(_helper("T"), ast.Constant(key), ast.Load())
+            return ast.Call(target, args, [])
+        if isinstance(node, Index):
+            return ast.Subscript(self._expr(node.target), self._expr(node.index), ast.Load())
+        if isinstance(node, ListLiteral):
+            return ast.List([self._expr(i) for i in node.items], ast.Load())
+        raise _CannotLower(type(node).__name__)
+
+    def _load(self, name: str) -> ast.expr:
+        _check_name(name)
+        if self._locals is not None and name in self._locals:
+            if name in self._defined:
+                return ast.Name(name, ast.Load())
+            # Atanmamis yerel ad globale duser.
+            self._checked.add(name)
+            return ast.IfExp(
+                ast.Compare(ast.Name(name, ast.Load()), [ast.IsNot()], [_helper("U")]),
+                ast.Name(name, ast.Load()),
+                ast.Call(_helper("load"), [ast.Constant(name)], []),
+            )
+        if name in PYTHON_BUILTIN_NAMES:
+            return ast.Call(_helper("load"), [ast.Constant(name)], [])
+        return ast.Name(name, ast.Load())
+
+
+def _arguments(names: List[str]) -> ast.arguments:
+    return ast.arguments([], [ast.arg(n) for n in names], None, [], [], None, [])
+
+
+def _truth(expr: ast.expr) -> ast.expr:
+    return ast.UnaryOp(ast.Not(), ast.UnaryOp(ast.Not(), expr))
+
+
+def _collect_targets(body: List[Node], out: Set[str]) -> None:
+    for node in body:
+        if isinstance(node, (Assign, Import)):
+            out.add(node.name)
+        elif isinstance(node, If):
+            _collect_targets(node.then_body, out)
+            if node.else_body is not None:
+                _collect_targets(node.else_body, out)
+        elif isinstance(node, While):
+            _collect_targets(node.body, out)
+        elif isinstance(node, For):
+            out.add(node.var)
+            _collect_targets(node.body, out)
+
+
+class _Targets(dict):
+    def __init__(self, compiler: "PythonCompiler") -> None:
+        super().__init__()
+        self.compiler = compiler
+
+    def __missing__(self, key: str) -> Callable[..., Any]:
+        target = self.compiler.resolve_target(key)
+        self[key] = target
+        return target
+
+
+class PythonCompiler:
+    def __init__(self, interp: Any) -> None:
+        self.interp = interp
+        self.sites: Dict[str, CallSite] = {}
+        self.targets = _Targets(self)
+        self.fallbacks = 0
+        self._functions: Dict[int, Tuple[FuncDef, Callable[..., Any]]] = {}
+        self._versions = (-1, -1)
+
+    def site_key(self, name: str, argc: int) -> str:
+        key = f"{name}/{argc}"
+        if key not in self.sites:
+            self.sites[key] = CallSite(name, argc)
+        return key
+
+    def resolve_target(self, key: str) -> Callable[..., Any]:
+        site = self.sites[key]
+        self.interp.resolve_call_site(site)
+        if site.builtin is not None:
+            return site.builtin
+        return self.function_for(site.func)
+
+    def function_for(self, func: FuncDef) -> Callable[..., Any]:
+        entry = self._functions.get(id(func))
+        if entry is not None and entry[0] is func:
+            return entry[1]
+        return functools.partial(self._tree_call, func)
+
+    def _tree_call(self, func: FuncDef, *args: Any) -> Any:
+        return self.interp._run_function(func, dict(zip(func.params, args)))
+
+    def _sync(self) -> None:
+        versions = (self.interp.functions.version, self.interp.builtins.version)
+        if versions != self._versions:
+            self.targets.clear()
+            self._versions = versions
+
+    def _load(self, name: str) -> Any:
+        g = self.interp.globals
+        if name in g:
+            return g[name]
+        raise NameError(f"Tanımsız değişken: {name}")
+
+    def _import(self, name: str) -> Any:
+        env: Dict[str, Any] = {}
+        self.interp._import_module(name, env)
+        self._sync()
+        return env[name]
+
+    def compile_program(self, program: Program) -> Optional[Callable[[], Any]]:
+        lowering = _Lowering(self)
+        try:
+            module = lowering.lower_program(program)
+            code = compile(module, FILENAME, "exec")
+        except (_CannotLower, SyntaxError, ValueError, TypeError):
+            return None
+        factory_code = next(c for c in code.co_consts if isinstance(c, types.CodeType))
+        factory = types.FunctionType(factory_code, self.interp.globals)
+
+        funcs = lowering.funcs
+        functions = self.interp.functions
+
+        def define(index: int) -> None:
+            functions[funcs[index].name] = funcs[index]
+            self._sync()
+
+        main, compiled = factory(
+            self.targets, UNBOUND, self._load, define, self._import, print, counted_range
+        )
+        for func, pyfunc in zip(funcs, compiled):
+            pyfunc.__name__ = pyfunc.__qualname__ = func.name
+            pyfunc.__code__ = pyfunc.__code__.replace(co_name=func.name)
+            self._functions[id(func)] = (func, pyfunc)
+        return main
+
+    def run_program(self, program: Program) -> None:
+        resolve(program, self.interp).raise_errors()
+        main = self.compile_program(program)
+        if main is None:
+            self.fallbacks += 1
+            self.interp._exec_block(program.body, self.interp.globals)
+            return
+        self._run(main)
+
+    def call(self, func: FuncDef, args: List[Any]) -> Any:
+        if len(args) != len(func.params):
+            raise TypeError(f"{func.name} parametre sayisi uyusmuyor")
+        return self._run(self.function_for(func), *args)
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._sync()
+        try:
+            return fn(*args)
+        except NameError as e:
+            translated = _translate_name_error(e)
+            if translated is None:
+                raise
+            raise translated from None
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .interpreter import (
+    STDLIB_MODULES,
+    Assign,
+    BinOp,
+    Call,
+    ExprStmt,
+    For,
+    FuncDef,
+    If,
+    Import,
+    Index,
+    IndexAssign,
+    ListLiteral,
+    Node,
+    Program,
+    Return,
+    UnaryOp,
+    Var,
+    While,
+    _norm_name,
+)
+
+
+class _Unbound:
+    def __repr__(self) -> str:
+        return "<unbound>"
+
+
+UNBOUND = _Unbound()
+
+
+class Frame:
+    __slots__ = ("values",)
+
+    def __init__(self, size: int) -> None:
+        self.values: List[Any] = [UNBOUND] * size
+
+
+class FunctionLayout:
+    __slots__ = ("name", "varnames", "slots")
+
+    def __init__(self, name: str, varnames: List[str]) -> None:
+        self.name = name
+        self.varnames = varnames
+        self.slots: Dict[str, int] = {n: i for i, n in enumerate(varnames)}
+
+    @property
+    def size(self) -> int:
+        return len(self.varnames)
+
+    def new_frame(self, args: List[Any]) -> Frame:
+        frame = Frame(len(self.varnames))
+        frame.values[: len(args)] = args
+        return frame
+
+
+class ResolveError(NameError):
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__("Cozumlenemeyen adlar:\n" + "\n".join(f"  {e}" for e in errors))
+        self.errors = errors
+
+
+def _collect_locals(body: List[Node], out: List[str], seen: Set[str]) -> None:
+    for node in body:
+        if isinstance(node, (Assign, Import)):
+            if node.name not in seen:
+                seen.add(node.name)
+                out.append(node.name)
+        elif isinstance(node, If):
+            _collect_locals(node.then_body, out, seen)
+            if node.else_body is not None:
+                _collect_locals(node.else_body, out, seen)
+        elif isinstance(node, While):
+            _collect_locals(node.body, out, seen)
+        elif isinstance(node, For):
+            if node.var not in seen:
+                seen.add(node.var)
+                out.append(node.var)
+            _collect_locals(node.body, out, seen)
+
+
+def function_layout(func: FuncDef) -> FunctionLayout:
+    varnames = list(func.params)
+    _collect_locals(func.body, varnames, set(varnames))
+    return FunctionLayout(func.name, varnames)
+
+
+def _module_exports(name: str) -> Optional[List[str]]:
+    if name not in STDLIB_MODULES:
+        return None
+    mod = importlib.import_module(STDLIB_MODULES[name])
+    return [_norm_name(f) for f in getattr(mod, "__all__", [])]
+
+
+class Resolver:
+    def __init__(
+        self,
+        known_globals: Iterable[str] = (),
+        known_builtins: Iterable[str] = (),
+        known_functions: Iterable[str] = (),
+        load_module: Optional[Callable[[str], Optional[Program]]] = None,
+    ) -> None:
+        # Dugum de saklanir; boylece id() baska bir dugum icin yeniden kullanilamaz.
+        self.layouts: Dict[int, Tuple[FuncDef, FunctionLayout]] = {}
+        self.errors: List[str] = []
+        self._globals: Set[str] = set(known_globals)
+        self._builtins: Set[str] = set(known_builtins)
+        self._functions: Set[str] = set(known_functions)
+        self._load_module = load_module
+        self._modules: Set[int] = set()
+        self._check_calls = True
+        self._line = 0
+
+    def resolve(self, program: Program) -> "Resolver":
+        self._declare(program.body, top_level=True)
+        self._check_block(program.body, None)
+        return self
+
+    def raise_errors(self) -> None:
+        if self.errors:
+            raise ResolveError(self.errors)
+
+    def _declare(self, body: List[Node], top_level: bool) -> None:
+        for node in body:
+            if isinstance(node, Assign):
+                if top_level:
+                    self._globals.add(node.name)
+            elif isinstance(node, Import):
+                if top_level:
+                    self._globals.add(node.name)
+                exports = _module_exports(node.name)
+                if exports is not None:
+                    self._builtins.update(exports)
+                    continue
+                module = self._load_module(node.name) if self._load_module is not None else None
+                if module is None:
+                    self._check_calls = False
+                elif id(module) not in self._modules:
+                    # Kullanici modulu her zaman global kapsamda calisir; adlari globale eklenir.
+                    self._modules.add(id(module))
+                    self._declare(module.body, top_level=True)
+            elif isinstance(node, If):
+                self._declare(node.then_body, top_level)
+                if node.else_body is not None:
+                    self._declare(node.else_body, top_level)
+            elif isinstance(node, While):
+                self._declare(node.body, top_level)
+            elif isinstance(node, For):
+                if top_level:
+                    self._globals.add(node.var)
+                self._declare(node.body, top_level)
+            elif isinstance(node, FuncDef):
+                self._functions.add(node.name)
+                self._declare(node.body, top_level=False)
+
+    def _check_block(self, body: List[Node], layout: Optional[FunctionLayout]) -> None:
+        for node in body:
+            self._line = node.line
+            if isinstance(node, Assign):
+                self._check_expr(node.value, layout)
+            elif isinstance(node, ExprStmt):
+                self._check_expr(node.expr, layout)
+            elif isinstance(node, IndexAssign):
+                self._check_expr(node.value, layout)
+                self._check_expr(node.target, layout)
+                self._check_expr(node.index, layout)
+            elif isinstance(node, If):
+                self._check_expr(node.cond, layout)
+                self._check_block(node.then_body, layout)
+                if node.else_body is not None:
+                    self._check_block(node.else_body, layout)
+            elif isinstance(node, While):
+                self._check_expr(node.cond, layout)
+                self._check_block(node.body, layout)
+            elif isinstance(node, For):
+                self._check_expr(node.start, layout)
+                self._check_expr(node.end, layout)
+                self._check_block(node.body, layout)
+            elif isinstance(node, Return):
+                if node.value:
+                    self._check_expr(node.value, layout)
+            elif isinstance(node, FuncDef):
+                func_layout = function_layout(node)
+                self.layouts[id(node)] = (node, func_layout)
+                self._check_block(node.body, func_layout)
+
+    def _check_expr(self, node: Node, layout: Optional[FunctionLayout]) -> None:
+        if isinstance(node, Var):
+            if layout is not None and node.name in layout.slots:
+                return
+            if node.name not in self._globals:
+                self.errors.append(f"satir {self._line}: Tanımsız değişken: {node.name}")
+        elif isinstance(node, BinOp):
+            self._check_expr(node.left, layout)
+            self._check_expr(node.right, layout)
+        elif isinstance(node, UnaryOp):
+            self._check_expr(node.expr, layout)
+        elif isinstance(node, Index):
+            self._check_expr(node.target, layout)
+            self._check_expr(node.index, layout)
+        elif isinstance(node, ListLiteral):
+            for item in node.items:
+                self._check_expr(item, layout)
+        elif isinstance(node, Call):
+            norm = _norm_name(node.name)
+            if (
+                self._check_calls
+                and norm != "yazdir"
+                and norm not in self._builtins
+                and node.name not in self._functions
+            ):
+                self.errors.append(f"satir {self._line}: Bilinmeyen fonksiyon: {node.name}")
+            for a in node.args:
+                self._check_expr(a, layout)
+
+
+def resolve(program: Program, interp: Any = None) -> Resolver:
+    if interp is None:
+        return Resolver().resolve(program)
+    return Resolver(interp.globals, interp.builtins, interp.functions, interp.load_module).resolve(program)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+from .interpreter import Interpreter
+
+TAYLAN_FILENAME = "<taylan>"
+MODULE = "<modul>"
+
+_CORE_DIR = os.path.dirname(os.path.abspath(__file__))
+_RUN_FUNCTION = Interpreter._run_function.__code__
+_EXEC = Interpreter._exec.__code__
+
+
+_internal_files: Dict[str, bool] = {}
+
+
+def _is_internal(filename: str) -> bool:
+    internal = _internal_files.get(filename)
+    if internal is None:
+        internal = filename == TAYLAN_FILENAME or os.path.dirname(os.path.abspath(filename)) == _CORE_DIR
+        _internal_files[filename] = internal
+    return internal
+
+
+def _taylan_stack(frame: Optional[FrameType]) -> List[str]:
+    frames: List[FrameType] = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+
+    stack: List[str] = []
+    names: List[str] = []
+    last_taylan = -1
+    for i, f in enumerate(frames):
+        code = f.f_code
+        if code is _RUN_FUNCTION:
+            func = f.f_locals.get("func")
+            names.append(getattr(func, "name", "?"))
+            stack.append(f"{names[-1]}:0")
+            last_taylan = i
+        elif code is _EXEC:
+            node = f.f_locals.get("node")
+            if not stack:
+                names.append(MODULE)
+                stack.append(f"{MODULE}:0")
+            stack[-1] = f"{names[-1]}:{getattr(node, 'line', 0)}"
+            last_taylan = i
+        elif code.co_filename == TAYLAN_FILENAME:
+            name = MODULE if code.co_name.startswith("__taylan_") else code.co_name
+            names.append(name)
+            stack.append(f"{name}:{f.f_lineno}")
+            last_taylan = i
+    if last_taylan < 0:
+        return stack
+    # Taylan'dan cagrilan builtinler (ornegin tweb_baslat) ve altindaki Python cagrilari.
+    for f in frames[last_taylan + 1:]:
+        if not _is_internal(f.f_code.co_filename):
+            stack.append(f"py:{f.f_code.co_name}")
+    return stack
+
+
+# Arka planda calisan ornekleyici: belirli araliklarla hedef is parcaciginin
+# Python cercevelerinden Taylan cagri yiginini cikarir (agac yorumlayicisinda
+# `_run_function`/`_exec` cerceveleri, python motorunda `<taylan>` kod
+# nesneleri). Yorumlayiciya ek kod eklenmez; maliyet yalnizca ornek aninda odenir.
+class Sampler:
+    def __init__(
+        self,
+        interval: float = 0.005,
+        output: Optional[str] = None,
+        flush_every: float = 0.0,
+        thread_id: Optional[int] = None,
+    ) -> None:
+        self.interval = interval
+        self.output = output
+        self.flush_every = flush_every
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Sampler":
+        self._thread = threading.Thread(target=self._loop, name="taylan-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.output:
+            self.write(self.output)
+
+    def __enter__(self) -> "Sampler":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def sample(self) -> None:
+        frame = sys._current_frames().get(self.thread_id)
+        stack = _taylan_stack(frame)
+        if not stack:
+            return
+        with self._lock:
+            self.counts[tuple(stack)] += 1
+            self.samples += 1
+
+    def _loop(self) -> None:
+        last_flush = time.monotonic()
+        while not self._stop.wait(self.interval):
+            self.sample()
+            if self.output and self.flush_every and time.monotonic() - last_flush >= self.flush_every:
+                self.write(self.output)
+                last_flush = time.monotonic()
+
+    def collapsed(self) -> List[Tuple[str, int]]:
+        with self._lock:
+            items = list(self.counts.items())
+        return sorted((";".join(stack), count) for stack, count in items)
+
+    def write(self, path: str) -> None:
+        lines = [f"{stack} {count}\n" for stack, count in self.collapsed()]
+        folder = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=folder, prefix=".taylan-sampler-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import re
+from typing import Any, List, Tuple
+
+from .interpreter import (
+    Assign,
+    BinOp,
+    Bool,
+    Call,
+    ExprStmt,
+    For,
+    FuncDef,
+    If,
+    Import,
+    Index,
+    IndexAssign,
+    ListLiteral,
+    Node,
+    Number,
+    Program,
+    Return,
+    String,
+    UnaryOp,
+    Var,
+    While,
+)
+
+INDENT = "    "
+
+# Parser oncelik seviyeleri: veya < ve < degil < karsilastirma < +,- < *,/,% < tekli < birincil
+BINARY_PRECEDENCE = {
+    "veya": 1,
+    "ve": 2,
+    "==": 4,
+    "!=": 4,
+    "<": 4,
+    ">": 4,
+    "<=": 4,
+    ">=": 4,
+    "+": 5,
+    "-": 5,
+    "*": 6,
+    "/": 6,
+    "%": 6,
+}
+NOT_PRECEDENCE = 3
+UNARY_PRECEDENCE = 7
+PRIMARY_PRECEDENCE = 8
+
+_NUMBER_LITERAL_RE = re.compile(r"\d+(?:\.\d*)?")
+
+
+def is_literal_value(value: Any) -> bool:
+    if isinstance(value, bool):
+        return True
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return _NUMBER_LITERAL_RE.fullmatch(repr(abs(value))) is not None
+    if isinstance(value, str):
+        return '"' not in value and "\n" not in value
+    return False
+
+
+def _number(value: Any) -> str:
+    if not is_literal_value(value):
+        raise ValueError(f"Kaynak koda yazilamayan sayi: {value!r}")
+    return repr(value)
+
+
+def _expr(node: Node) -> Tuple[str, int]:
+    if isinstance(node, Number):
+        text = _number(node.value)
+        return text, UNARY_PRECEDENCE if text.startswith("-") else PRIMARY_PRECEDENCE
+    if isinstance(node, String):
+        if not is_literal_value(node.value):
+            raise ValueError(f"Kaynak koda yazilamayan metin: {node.value!r}")
+        return f'"{node.value}"', PRIMARY_PRECEDENCE
+    if isinstance(node, Bool):
+        return ("dogru" if node.value else "yanlis"), PRIMARY_PRECEDENCE
+    if isinstance(node, Var):
+        return node.name, PRIMARY_PRECEDENCE
+    if isinstance(node, Call):
+        return f"{node.name}({', '.join(unparse_expr(a) for a in node.args)})", PRIMARY_PRECEDENCE
+    if isinstance(node, ListLiteral):
+        return f"[{', '.join(unparse_expr(i) for i in node.items)}]", PRIMARY_PRECEDENCE
+    if isinstance(node, Index):
+        return f"{_wrap(node.target, PRIMARY_PRECEDENCE)}[{unparse_expr(node.index)}]", PRIMARY_PRECEDENCE
+    if isinstance(node, UnaryOp):
+        if node.op == "degil":
+            return f"degil {_wrap(node.expr, NOT_PRECEDENCE)}", NOT_PRECEDENCE
+        operand = _wrap(node.expr, UNARY_PRECEDENCE)
+        if operand[0] in "+-":
+            operand = f"({operand})"
+        return f"{node.op}{operand}", UNARY_PRECEDENCE
+    if isinstance(node, BinOp):
+        prec = BINARY_PRECEDENCE[node.op]
+        left = _wrap(node.left, prec)
+        right = _wrap(node.right, prec + 1)
+        return f"{left} {node.op} {right}", prec
+    raise RuntimeError("Bilinmeyen ifade")
+
+
+def _wrap(node: Node, min_prec: int) -> str:
+    text, prec = _expr(node)
+    if prec < min_prec:
+        return f"({text})"
+    return text
+
+
+def unparse_expr(node: Node) -> str:
+    return _expr(node)[0]
+
+
+def _block(body: List[Node], indent: int, out: List[str]) -> None:
+    for node in body:
+        _stmt(node, indent, out)
+
+
+def _stmt(node: Node, indent: int, out: List[str]) -> None:
+    pad = INDENT * indent
+    if isinstance(node, Assign):
+        out.append(f"{pad}{node.name} = {unparse_expr(node.value)}")
+    elif isinstance(node, ExprStmt):
+        out.append(f"{pad}{unparse_expr(node.expr)}")
+    elif isinstance(node, IndexAssign):
+        target = _wrap(node.target, PRIMARY_PRECEDENCE)
+        out.append(f"{pad}{target}[{unparse_expr(node.index)}] = {unparse_expr(node.value)}")
+    elif isinstance(node, If):
+        out.append(f"{pad}eger {unparse_expr(node.cond)}:")
+        _block(node.then_body, indent + 1, out)
+        if node.else_body is not None:
+            out.append(f"{pad}degilse:")
+            _block(node.else_body, indent + 1, out)
+        out.append(f"{pad}bitti")
+    elif isinstance(node, While):
+        out.append(f"{pad}dongu {unparse_expr(node.cond)}:")
+        _block(node.body, indent + 1, out)
+        out.append(f"{pad}bitti")
+    elif isinstance(node, For):
+        out.append(f"{pad}icin {node.var} = {unparse_expr(node.start)}, {unparse_expr(node.end)}:")
+        _block(node.body, indent + 1, out)
+        out.append(f"{pad}bitti")
+    elif isinstance(node, FuncDef):
+        out.append(f"{pad}fonksiyon {node.name}({', '.join(node.params)}):")
+        _block(node.body, indent + 1, out)
+        out.append(f"{pad}bitti")
+    elif isinstance(node, Return):
+        if node.value:
+            out.append(f"{pad}don {unparse_expr(node.value)}")
+        else:
+            out.append(f"{pad}don")
+    elif isinstance(node, Import):
+        out.append(f'{pad}dahil "{node.name}"')
+    else:
+        raise RuntimeError("Bilinmeyen ifade")
+
+
+def unparse(program: Program) -> str:
+    out: List[str] = []
+    _block(program.body, 0, out)
+    return "\n".join(out) + "\n"
@@ -0,0 +1,545 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from .interpreter import (
+    Assign,
+    BinOp,
+    Bool,
+    Call,
+    CallSite,
+    ExprStmt,
+    For,
+    FuncDef,
+    If,
+    Import,
+    Index,
+    IndexAssign,
+    ListLiteral,
+    Node,
+    Number,
+    Program,
+    Return,
+    String,
+    UnaryOp,
+    Var,
+    While,
+    _norm_name,
+    counted_range,
+)
+from .resolver import UNBOUND, Frame, function_layout, resolve
+
+NOP = 0
+LOAD_CONST = 1
+LOAD_LOCAL = 2
+STORE_LOCAL = 3
+LOAD_GLOBAL = 4
+STORE_GLOBAL = 5
+POP_TOP = 6
+BINARY_ADD = 7
+BINARY_SUB = 8
+BINARY_MUL = 9
+BINARY_DIV = 10
+BINARY_MOD = 11
+BINARY_AND = 12
+BINARY_OR = 13
+COMPARE_OP = 14
+UNARY_NEG = 15
+UNARY_POS = 16
+UNARY_NOT = 17
+JUMP = 18
+JUMP_IF_FALSE = 19
+CALL = 20
+PRINT = 21
+RETURN_VALUE = 22
+DEF_FUNC = 23
+IMPORT = 24
+GET_RANGE = 25
+FOR_ITER = 26
+BUILD_LIST = 27
+BINARY_SUBSCR = 28
+STORE_SUBSCR = 29
+
+OPNAMES = [
+    "NOP",
+    "LOAD_CONST",
+    "LOAD_LOCAL",
+    "STORE_LOCAL",
+    "LOAD_GLOBAL",
+    "STORE_GLOBAL",
+    "POP_TOP",
+    "BINARY_ADD",
+    "BINARY_SUB",
+    "BINARY_MUL",
+    "BINARY_DIV",
+    "BINARY_MOD",
+    "BINARY_AND",
+    "BINARY_OR",
+    "COMPARE_OP",
+    "UNARY_NEG",
+    "UNARY_POS",
+    "UNARY_NOT",
+    "JUMP",
+    "JUMP_IF_FALSE",
+    "CALL",
+    "PRINT",
+    "RETURN_VALUE",
+    "DEF_FUNC",
+    "IMPORT",
+    "GET_RANGE",
+    "FOR_ITER",
+    "BUILD_LIST",
+    "BINARY_SUBSCR",
+    "STORE_SUBSCR",
+]
+
+HAS_CONST = {LOAD_CONST, DEF_FUNC}
+HAS_LOCAL = {LOAD_LOCAL, STORE_LOCAL}
+HAS_NAME = {LOAD_GLOBAL, STORE_GLOBAL, IMPORT}
+HAS_JUMP = {JUMP, JUMP_IF_FALSE, FOR_ITER}
+
+BINARY_OPCODES = {
+    "+": BINARY_ADD,
+    "-": BINARY_SUB,
+    "*": BINARY_MUL,
+    "/": BINARY_DIV,
+    "%": BINARY_MOD,
+    "ve": BINARY_AND,
+    "veya": BINARY_OR,
+}
+
+COMPARE_OPS = ("==", "!=", "<", ">", "<=", ">=")
+
+UNARY_OPCODES = {
+    "-": UNARY_NEG,
+    "+": UNARY_POS,
+    "degil": UNARY_NOT,
+}
+
+
+class CodeObject:
+    def __init__(self, name: str, params: List[str]) -> None:
+        self.name = name
+        self.params = list(params)
+        self.instructions: List[int] = []
+        self.consts: List[Any] = []
+        self.names: List[str] = []
+        self.varnames: List[str] = list(params)
+        self.calls: List[CallSite] = []
+
+    @property
+    def nlocals(self) -> int:
+        return len(self.varnames)
+
+    def __repr__(self) -> str:
+        return f"<code {self.name}>"
+
+
+class FunctionConst:
+    def __init__(self, func: FuncDef, code: CodeObject) -> None:
+        self.func = func
+        self.code = code
+
+    def __repr__(self) -> str:
+        return f"<fonksiyon {self.func.name}>"
+
+
+class BytecodeCompiler:
+    def __init__(self, code: CodeObject, is_module: bool) -> None:
+        self.code = code
+        self.is_module = is_module
+        self._const_index: Dict[Tuple[type, Any], int] = {}
+        self._name_index: Dict[str, int] = {}
+        self._local_index: Dict[str, int] = {}
+
+    def emit(self, op: int, arg: int = 0) -> int:
+        self.code.instructions.append(op)
+        self.code.instructions.append(arg)
+        return len(self.code.instructions) - 2
+
+    def here(self) -> int:
+        return len(self.code.instructions)
+
+    def patch(self, at: int, target: int) -> None:
+        self.code.instructions[at + 1] = target
+
+    def const(self, value: Any) -> int:
+        if isinstance(value, FunctionConst):
+            key: Tuple[Any, ...] = (FunctionConst, id(value))
+        elif type(value) is float:
+            # 0.0 == -0.0; isaret kaybolmasin diye float'lar bit duzeyinde ayrilir.
+            key = (float, value.hex())
+        else:
+            key = (type(value), value)
+        idx = self._const_index.get(key)
+        if idx is None:
+            idx = len(self.code.consts)
+            self.code.consts.append(value)
+            self._const_index[key] = idx
+        return idx
+
+    def name(self, name: str) -> int:
+        idx = self._name_index.get(name)
+        if idx is None:
+            idx = len(self.code.names)
+            self.code.names.append(name)
+            self._name_index[name] = idx
+        return idx
+
+    def load(self, name: str) -> None:
+        idx = self._local_index.get(name)
+        if idx is not None:
+            self.emit(LOAD_LOCAL, idx)
+        else:
+            self.emit(LOAD_GLOBAL, self.name(name))
+
+    def store(self, name: str) -> None:
+        if not self.is_module:
+            self.emit(STORE_LOCAL, self._local_index[name])
+        else:
+            self.emit(STORE_GLOBAL, self.name(name))
+
+    def compile_body(self, body: List[Node]) -> CodeObject:
+        self.block(body)
+        self.emit(LOAD_CONST, self.const(None))
+        self.emit(RETURN_VALUE)
+        return self.code
+
+    def block(self, body: List[Node]) -> None:
+        for stmt in body:
+            self.stmt(stmt)
+
+    def stmt(self, node: Node) -> None:
+        if isinstance(node, Assign):
+            self.expr(node.value)
+            self.store(node.name)
+        elif isinstance(node, ExprStmt):
+            self.expr(node.expr)
+            self.emit(POP_TOP)
+        elif isinstance(node, IndexAssign):
+            self.expr(node.value)
+            self.expr(node.target)
+            self.expr(node.index)
+            self.emit(STORE_SUBSCR)
+        elif isinstance(node, If):
+            self.expr(node.cond)
+            jump_else = self.emit(JUMP_IF_FALSE)
+            self.block(node.then_body)
+            if node.else_body is not None:
+                jump_end = self.emit(JUMP)
+                self.patch(jump_else, self.here())
+                self.block(node.else_body)
+                self.patch(jump_end, self.here())
+            else:
+                self.patch(jump_else, self.here())
+        elif isinstance(node, While):
+            start = self.here()
+            self.expr(node.cond)
+            jump_end = self.emit(JUMP_IF_FALSE)
+            self.block(node.body)
+            self.emit(JUMP, start)
+            self.patch(jump_end, self.here())
+        elif isinstance(node, For):
+            # Yineleyici dongu boyunca yigin uzerinde kalir; FOR_ITER bitince
+            # onu atip dongu sonuna atlar.
+            self.expr(node.start)
+            self.expr(node.end)
+            self.emit(GET_RANGE)
+            start = self.here()
+            jump_end = self.emit(FOR_ITER)
+            self.store(node.var)
+            self.block(node.body)
+            self.emit(JUMP, start)
+            self.patch(jump_end, self.here())
+        elif isinstance(node, FuncDef):
+            self.emit(DEF_FUNC, self.const(FunctionConst(node, compile_function(node))))
+        elif isinstance(node, Return):
+            if node.value:
+                self.expr(node.value)
+            else:
+                self.emit(LOAD_CONST, self.const(None))
+            self.emit(RETURN_VALUE)
+        elif isinstance(node, Import):
+            self.emit(IMPORT, self.name(node.name))
+            self.store(node.name)
+        else:
+            raise RuntimeError("Bilinmeyen ifade")
+
+    def expr(self, node: Node) -> None:
+        if isinstance(node, (Number, String, Bool)):
+            self.emit(LOAD_CONST, self.const(node.value))
+        elif isinstance(node, Var):
+            self.load(node.name)
+        elif isinstance(node, BinOp):
+            self.expr(node.left)
+            self.expr(node.right)
+            if node.op in COMPARE_OPS:
+                self.emit(COMPARE_OP, COMPARE_OPS.index(node.op))
+            elif node.op in BINARY_OPCODES:
+                self.emit(BINARY_OPCODES[node.op])
+            else:
+                raise RuntimeError("Bilinmeyen ifade")
+        elif isinstance(node, UnaryOp):
+            if node.op not in UNARY_OPCODES:
+                raise RuntimeError("Bilinmeyen ifade")
+            self.expr(node.expr)
+            self.emit(UNARY_OPCODES[node.op])
+        elif isinstance(node, Call):
+            for a in node.args:
+                self.expr(a)
+            norm = _norm_name(node.name)
+            if norm == "yazdir":
+                self.emit(PRINT, len(node.args))
+            else:
+                self.code.calls.append(CallSite(node.name, len(node.args)))
+                self.emit(CALL, len(self.code.calls) - 1)
+        elif isinstance(node, Index):
+            self.expr(node.target)
+            self.expr(node.index)
+            self.emit(BINARY_SUBSCR)
+        elif isinstance(node, ListLiteral):
+            for item in node.items:
+                self.expr(item)
+            self.emit(BUILD_LIST, len(node.items))
+        else:
+            raise RuntimeError("Bilinmeyen ifade")
+
+
+def compile_function(func: FuncDef) -> CodeObject:
+    layout = function_layout(func)
+    code = CodeObject(func.name, func.params)
+    code.varnames = layout.varnames
+    compiler = BytecodeCompiler(code, is_module=False)
+    compiler._local_index = layout.slots
+    return compiler.compile_body(func.body)
+
+
+def compile_program(program: Program) -> CodeObject:
+    return BytecodeCompiler(CodeObject("<modul>", []), is_module=True).compile_body(program.body)
+
+
+def _format_arg(code: CodeObject, op: int, arg: int) -> str:
+    if op in HAS_CONST:
+        return repr(code.consts[arg])
+    if op in HAS_LOCAL:
+        return code.varnames[arg]
+    if op in HAS_NAME:
+        return code.names[arg]
+    if op in HAS_JUMP:
+        return f"-> {arg}"
+    if op == COMPARE_OP:
+        return COMPARE_OPS[arg]
+    if op == CALL:
+        site = code.calls[arg]
+        return f"{site.name}/{site.argc}"
+    if op == PRINT:
+        return f"yazdir/{arg}"
+    if op == BUILD_LIST:
+        return f"{arg} eleman"
+    return ""
+
+
+def disassemble(code: CodeObject) -> str:
+    lines: List[str] = []
+    pending = [code]
+    while pending:
+        co = pending.pop(0)
+        if lines:
+            lines.append("")
+        params = ", ".join(co.params)
+        lines.append(f"{co.name}({params}):" if co.name != "<modul>" else f"{co.name}:")
+        ins = co.instructions
+        for pc in range(0, len(ins), 2):
+            op, arg = ins[pc], ins[pc + 1]
+            text = _format_arg(co, op, arg)
+            if text:
+                lines.append(f"  {pc:5} {OPNAMES[op]:<14} {arg:4} ({text})")
+            else:
+                lines.append(f"  {pc:5} {OPNAMES[op]}")
+        for c in co.consts:
+            if isinstance(c, FunctionConst):
+                pending.append(c.code)
+    return "\n".join(lines)
+
+
+class VM:
+    def __init__(self, interp: Any) -> None:
+        self.interp = interp
+        # Dugum de saklanir; boylece id() baska bir dugum icin yeniden kullanilamaz.
+        self.codes: Dict[int, Tuple[FuncDef, CodeObject]] = {}
+
+    def code_for(self, func: FuncDef) -> CodeObject:
+        entry = self.codes.get(id(func))
+        if entry is None or entry[0] is not func:
+            entry = (func, compile_function(func))
+            self.codes[id(func)] = entry
+        return entry[1]
+
+    def run_program(self, program: Program) -> None:
+        resolve(program, self.interp).raise_errors()
+        self.execute(compile_program(program), Frame(0).values)
+
+    def call(self, func: FuncDef, args: List[Any]) -> Any:
+        if len(args) != len(func.params):
+            raise TypeError(f"{func.name} parametre sayisi uyusmuyor")
+        code = self.code_for(func)
+        frame = Frame(code.nlocals)
+        frame.values[: len(args)] = args
+        return self.execute(code, frame.values)
+
+    def _load_global(self, name: str) -> Any:
+        g = self.interp.globals
+        if name in g:
+            return g[name]
+        raise NameError(f"Tanımsız değişken: {name}")
+
+    def execute(self, code: CodeObject, fast: List[Any]) -> Any:
+        interp = self.interp
+        g = interp.globals
+        builtins = interp.builtins
+        functions = interp.functions
+        ins = code.instructions
+        consts = code.consts
+        names = code.names
+        stack: List[Any] = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        while True:
+            op = ins[pc]
+            arg = ins[pc + 1]
+            pc += 2
+            if op == LOAD_LOCAL:
+                v = fast[arg]
+                if v is UNBOUND:
+                    v = self._load_global(code.varnames[arg])
+                push(v)
+            elif op == LOAD_CONST:
+                push(consts[arg])
+            elif op == LOAD_GLOBAL:
+                name = names[arg]
+                if name in g:
+                    push(g[name])
+                else:
+                    raise NameError(f"Tanımsız değişken: {name}")
+            elif op == STORE_LOCAL:
+                fast[arg] = pop()
+            elif op == STORE_GLOBAL:
+                g[names[arg]] = pop()
+            elif op == JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+            elif op == JUMP:
+                pc = arg
+            elif op == FOR_ITER:
+                v = next(stack[-1], UNBOUND)
+                if v is UNBOUND:
+                    pop()
+                    pc = arg
+                else:
+                    push(v)
+            elif op == COMPARE_OP:
+                r = pop()
+                l = stack[-1]
+                if arg == 0:
+                    stack[-1] = l == r
+                elif arg == 1:
+                    stack[-1] = l != r
+                elif arg == 2:
+                    stack[-1] = l < r
+                elif arg == 3:
+                    stack[-1] = l > r
+                elif arg == 4:
+                    stack[-1] = l <= r
+                else:
+                    stack[-1] = l >= r
+            elif op == BINARY_ADD:
+                r = pop()
+                stack[-1] = stack[-1] + r
+            elif op == BINARY_SUB:
+                r = pop()
+                stack[-1] = stack[-1] - r
+            elif op == BINARY_MUL:
+                r = pop()
+                stack[-1] = stack[-1] * r
+            elif op == BINARY_DIV:
+                r = pop()
+                stack[-1] = stack[-1] / r
+            elif op == BINARY_MOD:
+                r = pop()
+                stack[-1] = stack[-1] % r
+            elif op == BINARY_SUBSCR:
+                r = pop()
+                stack[-1] = stack[-1][r]
+            elif op == CALL:
+                site = code.calls[arg]
+                argc = site.argc
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                if site.functions_version != functions.version or site.builtins_version != builtins.version:
+                    interp.resolve_call_site(site)
+                else:
+                    interp.call_stats.hits += 1
+                builtin = site.builtin
+                if builtin is not None:
+                    push(builtin(*args))
+                    continue
+                func = site.func
+                entry = self.codes.get(id(func))
+                callee = entry[1] if entry is not None and entry[0] is func else self.code_for(func)
+                callee_frame = Frame(callee.nlocals)
+                callee_frame.values[:argc] = args
+                push(self.execute(callee, callee_frame.values))
+            elif op == RETURN_VALUE:
+                return pop()
+            elif op == POP_TOP:
+                pop()
+            elif op == BINARY_AND:
+                r = pop()
+                stack[-1] = bool(stack[-1]) and bool(r)
+            elif op == BINARY_OR:
+                r = pop()
+                stack[-1] = bool(stack[-1]) or bool(r)
+            elif op == UNARY_NEG:
+                stack[-1] = -stack[-1]
+            elif op == UNARY_POS:
+                stack[-1] = +stack[-1]
+            elif op == UNARY_NOT:
+                stack[-1] = not bool(stack[-1])
+            elif op == PRINT:
+                if arg:
+                    args = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    args = []
+                print(*args)
+                push(None)
+            elif op == STORE_SUBSCR:
+                index = pop()
+                target = pop()
+                target[index] = pop()
+            elif op == BUILD_LIST:
+                if arg:
+                    items = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    items = []
+                push(items)
+            elif op == GET_RANGE:
+                r = pop()
+                stack[-1] = iter(counted_range(stack[-1], r))
+            elif op == DEF_FUNC:
+                fc = consts[arg]
+                self.codes[id(fc.func)] = (fc.func, fc.code)
+                functions[fc.func.name] = fc.func
+            elif op == IMPORT:
+                env: Dict[str, Any] = {}
+                interp._import_module(names[arg], env)
+                push(env[names[arg]])
+            elif op == NOP:
+                pass
+            else:
+                raise RuntimeError(f"Bilinmeyen opcode: {op}")
@@ -12,6 +12,8 @@ class NativeCompileError(RuntimeError):
 
 
 _IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_STRING_RE = re.compile(r'"[^"]*"')
+_FOR_RE = re.compile(r"^(?:icin|için)\s+([A-Za-z_][A-Za-z0-9_]*)\s*=(.*)$")
 
 
 def _emit(buf: List[str], indent: int, text: str) -> None:
@@ -378,6 +380,7 @@ def compile_taylan_to_c(source: str) -> str:
     assigned_vars: set[str] = set()
     fn_param_names: set[str] = set()
     uses_web_runtime = False
+    loop_count = 0
 
     for raw in source.splitlines():
         line = raw.strip()
@@ -386,6 +389,10 @@ def compile_taylan_to_c(source: str) -> str:
         if line.startswith("#"):
             continue
 
+        if "[" in _STRING_RE.sub("", line):
+            # Degerler C'de double; dizi turu yok.
+            raise NativeCompileError(f"Dizi sozdizimi native derleyicide desteklenmiyor: {line}")
+
         if "tweb_baslat(" in line or "port_oku(" in line:
             uses_web_runtime = True
 
@@ -467,6 +474,29 @@ def compile_taylan_to_c(source: str) -> str:
                 main_indent += 1
             continue
 
+        if line.startswith("icin ") or line.startswith("için "):
+            m = _FOR_RE.match(_strip_colon(line))
+            bounds = _split_args(m.group(2)) if m else []
+            if len(bounds) != 2:
+                raise NativeCompileError(f"Gecersiz icin dongusu: {line}")
+            name = m.group(1)
+            if name not in fn_param_names:
+                assigned_vars.add(name)
+            # Sinirlar bir kez hesaplanir; dongu bitince degisken son
+            # turdaki degerini korur (yorumlayicidaki range ile ayni).
+            loop_count += 1
+            i_c, end_c = f"_icin{loop_count}", f"_son{loop_count}"
+            start = _convert_expr(bounds[0])
+            end = _convert_expr(bounds[1])
+            _emit(out, indent, f"for (double {i_c} = ({start}), {end_c} = ({end}); {i_c} < {end_c}; {i_c} += 1) {{")
+            _emit(out, indent + 1, f"{name} = {i_c};")
+            stack.append({"kind": "for"})
+            if in_func:
+                current_fn.indent += 1
+            else:
+                main_indent += 1
+            continue
+
         if line.startswith("dahil "):
             _emit(out, indent, f"/* {line} */")
             continue
@@ -549,12 +579,17 @@ def build_native(
     c_out: Optional[str] = None,
     cc: str = "gcc",
     emit_c_only: bool = False,
+    optimize: bool = False,
 ) -> Tuple[str, Optional[str]]:
     if not os.path.exists(input_path):
         raise NativeCompileError(f"Dosya yok: {input_path}")
 
     with open(input_path, "r", encoding="utf-8-sig") as f:
         source = f.read()
+    if optimize:
+        from .core.optimizer import optimize_source
+
+        source = optimize_source(source)
     c_code = compile_taylan_to_c(source)
 
     stem, _ = os.path.splitext(input_path)
@@ -0,0 +1,115 @@
+import importlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from typing import Any, Dict, Optional, TextIO
+
+from taylan.core.cache import load_program
+from taylan.core.interpreter import STDLIB_MODULES, Interpreter
+
+# Editor ile isci arasindaki protokol: her satir bir JSON nesnesi.
+#   editor -> isci: {"id": 1, "path": "a.tay", "source": "..."}
+#   isci -> editor: {"tip": "hazir"}
+#                   {"id": 1, "tip": "cikti", "akis": "stdout" | "stderr", "metin": "satir\n"}
+#                   {"id": 1, "tip": "bitti", "kod": 0, "sure_ms": 1.2}
+# Iptal icin editor isci surecini sonlandirip yenisini baslatir; yarida
+# kesilen bir programin yorumlayici durumu hicbir zaman yeniden kullanilmaz.
+
+
+class _Channel:
+    def __init__(self, out: TextIO) -> None:
+        self._out = out
+
+    def send(self, message: Dict[str, Any]) -> None:
+        self._out.write(json.dumps(message) + "\n")
+        self._out.flush()
+
+
+class _LineWriter(io.TextIOBase):
+    def __init__(self, channel: _Channel, request_id: Any, stream: str) -> None:
+        self._channel = channel
+        self._id = request_id
+        self._stream = stream
+        self._pending = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._pending += text
+        if "\n" in self._pending:
+            head, _, self._pending = self._pending.rpartition("\n")
+            for line in head.split("\n"):
+                self._emit(line + "\n")
+        return len(text)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._emit(self._pending)
+            self._pending = ""
+
+    def _emit(self, text: str) -> None:
+        self._channel.send({"id": self._id, "tip": "cikti", "akis": self._stream, "metin": text})
+
+
+def preload() -> None:
+    for module in STDLIB_MODULES.values():
+        try:
+            importlib.import_module(module)
+        except Exception:
+            # Opsiyonel bagimliligi eksik modul ilk `dahil`de hatasini verir.
+            pass
+
+
+def run_request(channel: _Channel, request: Dict[str, Any]) -> None:
+    request_id = request.get("id")
+    path = request.get("path") or "<editor>"
+    source = request.get("source", "")
+    stdout = _LineWriter(channel, request_id, "stdout")
+    stderr = _LineWriter(channel, request_id, "stderr")
+    saved = sys.stdout, sys.stderr, sys.stdin
+    cwd = os.getcwd()
+    code = 0
+    start = time.perf_counter()
+    try:
+        sys.stdout, sys.stderr, sys.stdin = stdout, stderr, io.StringIO("")
+        folder = os.path.dirname(os.path.abspath(path))
+        if os.path.isdir(folder):
+            os.chdir(folder)
+        program = load_program(path, source, use_cache=os.path.exists(path))
+        Interpreter(base_dir=os.getcwd(), engine=request.get("engine", "tree")).run_program(program)
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        code = 1
+        etype, value, _ = sys.exc_info()
+        stderr.write("".join(traceback.format_exception_only(etype, value)))
+    finally:
+        stdout.flush()
+        stderr.flush()
+        sys.stdout, sys.stderr, sys.stdin = saved
+        os.chdir(cwd)
+    channel.send({"id": request_id, "tip": "bitti", "kod": code, "sure_ms": (time.perf_counter() - start) * 1000})
+
+
+def serve(inp: Optional[TextIO] = None, out: Optional[TextIO] = None) -> int:
+    inp = inp or sys.stdin
+    channel = _Channel(out or sys.stdout)
+    preload()
+    channel.send({"tip": "hazir"})
+    for line in inp:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            channel.send({"tip": "hata", "metin": "Gecersiz istek"})
+            continue
+        if request.get("cmd") == "cik":
+            break
+        run_request(channel, request)
+    return 0
@@ -1,6 +1,9 @@
-﻿import os
+﻿import json
+import os
+import queue
 import subprocess
 import sys
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
@@ -54,6 +57,107 @@ def run_taylan(filepath: str) -> str:
         return f"Hata: {e}"
 
 
+def _worker_command() -> tuple[list[str], str] | None:
+    exe = _find_taylan_exe()
+    if exe:
+        return [exe, "isci"], os.path.dirname(exe)
+    if getattr(sys, "frozen", False):
+        return None
+    project_root = os.path.abspath(os.path.dirname(__file__))
+    return [sys.executable, "-m", "taylan.cli", "isci"], project_root
+
+
+# Arka planda hazir bekleyen `taylan isci` sureci: stdlib ve yorumlayici bir kez
+# yuklenir, her Calistir'da kaynak boru uzerinden gonderilir ve cikti satir satir
+# geri akar. Iptal sureci oldurur ve hemen yenisini isitir. `isci` komutunu
+# bilmeyen eski bir taylan.exe ile eski tek seferlik calistirmaya donulur.
+class WarmWorker:
+    def __init__(self) -> None:
+        self.events: queue.Queue = queue.Queue()
+        self.proc: subprocess.Popen | None = None
+        self.ready = False
+        self.disabled = False
+        self.running_id: int | None = None
+        self._next_id = 0
+
+    def start(self) -> bool:
+        cmd = _worker_command()
+        if cmd is None or self.disabled:
+            return False
+        argv, cwd = cmd
+        flags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+        try:
+            proc = subprocess.Popen(
+                argv,
+                cwd=cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+                creationflags=flags,
+            )
+        except OSError:
+            return False
+        self.proc = proc
+        self.ready = False
+        threading.Thread(target=self._read_stdout, args=(proc,), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(proc,), daemon=True).start()
+        return True
+
+    def _read_stdout(self, proc: subprocess.Popen) -> None:
+        for line in proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                msg = {"tip": "cikti", "akis": "stdout", "metin": line}
+            self.events.put((proc, msg))
+        self.events.put((proc, {"tip": "kapandi"}))
+
+    def _read_stderr(self, proc: subprocess.Popen) -> None:
+        for line in proc.stderr:
+            self.events.put((proc, {"tip": "cikti", "akis": "stderr", "metin": line}))
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def run(self, path: str, source: str) -> bool:
+        if not self.alive() and not self.start():
+            return False
+        self._next_id += 1
+        request = {"id": self._next_id, "path": path, "source": source}
+        try:
+            self.proc.stdin.write(json.dumps(request) + "\n")
+            self.proc.stdin.flush()
+        except OSError:
+            return False
+        self.running_id = self._next_id
+        return True
+
+    def cancel(self) -> None:
+        self.running_id = None
+        self.kill()
+        self.start()
+
+    def kill(self) -> None:
+        if self.proc is not None:
+            try:
+                self.proc.kill()
+            except OSError:
+                pass
+            self.proc = None
+
+    def stop(self) -> None:
+        if self.alive():
+            try:
+                self.proc.stdin.write(json.dumps({"cmd": "cik"}) + "\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        self.kill()
+
 
 def main():
     root = tk.Tk()
@@ -161,6 +265,11 @@ def main():
     btn_run.configure(bg=colors["accent"], fg="#1a1a1a", activebackground="#e2c27a")
     btn_run.pack(fill="x", padx=12, pady=10)
 
+    btn_stop = tk.Button(sidebar, text="Durdur")
+    style_button(btn_stop)
+    btn_stop.configure(state="disabled")
+    btn_stop.pack(fill="x", padx=12, pady=6)
+
     # Editor frame
     editor_frame = tk.Frame(main, bg=colors["border"], bd=1, relief="solid")
     editor_frame.pack(fill="both", expand=True)
@@ -258,27 +367,98 @@ def main():
         set_title(path)
         status.config(text="Kaydedildi")
 
+    worker = WarmWorker()
+    run_state = {"path": None, "has_output": False}
+
+    def run_blocking(path: str):
+        out = run_taylan(path)
+        output.delete("1.0", "end")
+        output.insert("1.0", out)
+        status.config(text="Calistirma tamamlandi")
+
+    def finish_run(text_status: str):
+        worker.running_id = None
+        if not run_state["has_output"]:
+            output.insert("end", "(cikti yok)")
+        btn_stop.configure(state="disabled")
+        status.config(text=text_status)
+
+    def poll_worker():
+        try:
+            while True:
+                proc, msg = worker.events.get_nowait()
+                if proc is not worker.proc:
+                    continue
+                kind = msg.get("tip")
+                if kind == "hazir":
+                    worker.ready = True
+                elif kind == "cikti":
+                    if worker.running_id is None or msg.get("id") not in (None, worker.running_id):
+                        continue
+                    run_state["has_output"] = True
+                    output.insert("end", msg.get("metin", ""))
+                    output.see("end")
+                elif kind == "bitti" and msg.get("id") == worker.running_id:
+                    finish_run(f"Calistirma tamamlandi (kod {msg.get('kod')}, {msg.get('sure_ms', 0):.0f} ms)")
+                elif kind == "kapandi":
+                    if worker.running_id is not None and not worker.ready:
+                        # Eski taylan.exe `isci` komutunu tanimiyor.
+                        worker.disabled = True
+                        worker.running_id = None
+                        btn_stop.configure(state="disabled")
+                        run_blocking(run_state["path"])
+                    elif worker.running_id is not None:
+                        finish_run("Isci beklenmedik sekilde durdu")
+                    worker.proc = None
+        except queue.Empty:
+            pass
+        root.after(20, poll_worker)
+
     def run_file():
         path = current_path["value"]
         if not path:
             messagebox.showinfo("Bilgi", "Once dosyayi kaydet.")
             return
         save_file()
-        status.config(text="Calistiriliyor...")
-        out = run_taylan(path)
+        if worker.running_id is not None:
+            worker.cancel()
         output.delete("1.0", "end")
-        output.insert("1.0", out)
-        status.config(text="Calistirma tamamlandi")
+        run_state["path"] = path
+        run_state["has_output"] = False
+        status.config(text="Calistiriliyor...")
+        if worker.run(path, text.get("1.0", "end-1c")):
+            btn_stop.configure(state="normal")
+            return
+        run_blocking(path)
+
+    def stop_run():
+        if worker.running_id is None:
+            return
+        worker.cancel()
+        output.insert("end", "\n(durduruldu)")
+        output.see("end")
+        btn_stop.configure(state="disabled")
+        status.config(text="Calistirma durduruldu")
+
+    def on_close():
+        worker.stop()
+        root.destroy()
 
     btn_new.configure(command=new_file)
     btn_open.configure(command=open_file)
     btn_save.configure(command=save_file)
     btn_run.configure(command=run_file)
+    btn_stop.configure(command=stop_run)
 
     root.bind("<Control-n>", lambda e: new_file())
     root.bind("<Control-o>", lambda e: open_file())
     root.bind("<Control-s>", lambda e: save_file())
     root.bind("<F5>", lambda e: run_file())
+    root.bind("<Shift-F5>", lambda e: stop_run())
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
+    worker.start()
+    poll_worker()
 
     if len(sys.argv) > 1:
         arg = sys.argv[1]
@@ -1,9 +1,58 @@
-﻿import time
+﻿import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional
 
-__all__ = ["bekle", "sayac"]
+__all__ = ["bekle", "sayac", "gorev_baslat", "gorev_bekle", "gorev_hazir_mi", "hepsini_bekle"]
+
+# Gorevler ortak bir is parcacigi havuzunda calisir. thttp/tsqlite cagrilari ve `bekle`
+# beklerken GIL'i birakir; boylece yavas G/C islemleri ayni anda ilerler.
+_ISCI_SAYISI = 64
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _havuz() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_ISCI_SAYISI, thread_name_prefix="tasync")
+    return _executor
+
+
+class Gorev:
+    __slots__ = ("ad", "_interp", "_args", "_is", "_sonuc")
+
+    def __init__(self, interp: Any, ad: str, args: List[Any]) -> None:
+        self.ad = ad
+        self._interp = interp
+        self._args = args
+        self._sonuc: Future = Future()
+        self._is = _havuz().submit(self._calistir)
+
+    def _calistir(self) -> None:
+        try:
+            self._sonuc.set_result(self._interp.call_function(self.ad, self._args))
+        except BaseException as e:
+            self._sonuc.set_exception(e)
+
+    def bekle(self, timeout: Optional[float]) -> Any:
+        # Henuz baslamamis gorev havuzdan alinip bekleyen is parcaciginda calistirilir;
+        # gorevi bekleyen gorevler havuzu tuketse bile kilitlenme olmaz. Zaman asimi
+        # verilmisse satir ici calistirilmaz: gorevin tum suresi boyunca bloklanirdi.
+        if timeout is None and self._is.cancel():
+            self._calistir()
+        return self._sonuc.result(timeout)
+
+    def __repr__(self) -> str:
+        durum = "bitti" if self._sonuc.done() else "suruyor"
+        return f"<gorev {self.ad} {durum}>"
 
 
 def bekle(ms: int) -> str:
+    # Yalnizca cagiran is parcacigini uyutur; diger gorevler calismaya devam eder.
     time.sleep(ms / 1000.0)
     return "ok"
 
@@ -11,4 +60,42 @@ def bekle(ms: int) -> str:
 def sayac(n: int) -> str:
     for i in range(int(n)):
         time.sleep(0.1)
-    return "ok"
+    return "ok"
+
+
+def gorev_baslat(interp: Any, fonksiyon_adi: str, *args: Any) -> Gorev:
+    name = str(fonksiyon_adi)
+    if name not in interp.functions:
+        raise NameError(f"Bilinmeyen fonksiyon: {name}")
+    if len(args) != len(interp.functions[name].params):
+        raise TypeError(f"{name} parametre sayisi uyusmuyor")
+    return Gorev(interp, name, list(args))
+
+
+gorev_baslat.taylan_interp = True
+
+
+def _gorev(gorev: Any) -> Gorev:
+    if not isinstance(gorev, Gorev):
+        raise TypeError("gorev bekleniyordu (gorev_baslat ile olusturun)")
+    return gorev
+
+
+def gorev_bekle(gorev: Any, zaman_asimi_ms: Optional[float] = None) -> Any:
+    g = _gorev(gorev)
+    timeout = None if zaman_asimi_ms is None else zaman_asimi_ms / 1000.0
+    try:
+        return g.bekle(timeout)
+    except TimeoutError:
+        if g._sonuc.done():
+            raise
+        raise TimeoutError(f"gorev_bekle: {g.ad} {zaman_asimi_ms} ms icinde bitmedi") from None
+
+
+def gorev_hazir_mi(gorev: Any) -> bool:
+    return _gorev(gorev)._sonuc.done()
+
+
+def hepsini_bekle(gorevler: List[Any]) -> List[Any]:
+    return [_gorev(g).bekle(None) for g in gorevler]
+
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Any, List
+from typing import Any, Dict, List
 
 __all__ = [
     "dosya_oku",
@@ -26,6 +26,21 @@ __all__ = [
     "metin_iceriyor_mu",
     "metin_degistir",
     "metin_bul",
+    "metin_yapici_olustur",
+    "metin_yapici_ekle",
+    "metin_yapici_satir_ekle",
+    "metin_yapici_uzunluk",
+    "metin_yapici_bitir",
+    "metin_yapici_dosyaya_yaz",
+    "sozluk_olustur",
+    "sozluk_yaz",
+    "sozluk_getir",
+    "sozluk_var_mi",
+    "sozluk_sil",
+    "sozluk_anahtarlar",
+    "sozluk_degerler",
+    "sozluk_ciftler",
+    "sozluk_uzunluk",
     "arg_getir",
     "arg_sayisi",
     "satir_sonu",
@@ -76,6 +91,48 @@ def dizi_yaz(arr: List[Any], index: int, value: Any) -> Any:
     return value
 
 
+# Sozluk dogrudan Python dict'idir: tjson ile json_parse/json_dok arasinda
+# donusturme gerekmez ve `s["anahtar"]` sozdizimiyle de okunup yazilabilir.
+def sozluk_olustur() -> Dict[Any, Any]:
+    return {}
+
+
+def sozluk_yaz(d: Dict[Any, Any], key: Any, value: Any) -> Any:
+    d[key] = value
+    return value
+
+
+def sozluk_getir(d: Dict[Any, Any], key: Any, default: Any = None) -> Any:
+    return d.get(key, default)
+
+
+def sozluk_var_mi(d: Dict[Any, Any], key: Any) -> bool:
+    return key in d
+
+
+def sozluk_sil(d: Dict[Any, Any], key: Any) -> bool:
+    if key in d:
+        del d[key]
+        return True
+    return False
+
+
+def sozluk_anahtarlar(d: Dict[Any, Any]) -> List[Any]:
+    return list(d)
+
+
+def sozluk_degerler(d: Dict[Any, Any]) -> List[Any]:
+    return list(d.values())
+
+
+def sozluk_ciftler(d: Dict[Any, Any]) -> List[List[Any]]:
+    return [[k, v] for k, v in d.items()]
+
+
+def sozluk_uzunluk(d: Dict[Any, Any]) -> int:
+    return len(d)
+
+
 def metin(value: Any) -> str:
     return str(value)
 
@@ -133,6 +190,65 @@ def metin_bul(value: str, needle: str) -> int:
     return str(value).find(str(needle))
 
 
+# Parcalari listede biriktirir; metin_birlesik zincirinin aksine her ekleme
+# onceki metni kopyalamaz, toplam maliyet uretilen metnin boyuyla dogrusaldir.
+class MetinYapici:
+    __slots__ = ("parts", "length")
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.length = 0
+
+    def append(self, text: str) -> None:
+        self.parts.append(text)
+        self.length += len(text)
+
+    def finish(self) -> str:
+        if len(self.parts) > 1:
+            self.parts = ["".join(self.parts)]
+        return self.parts[0] if self.parts else ""
+
+    def __str__(self) -> str:
+        return self.finish()
+
+    def __repr__(self) -> str:
+        return f"<metin_yapici {self.length} karakter>"
+
+
+def metin_yapici_olustur(baslangic: Any = "") -> MetinYapici:
+    builder = MetinYapici()
+    if baslangic != "":
+        builder.append(str(baslangic))
+    return builder
+
+
+def metin_yapici_ekle(builder: MetinYapici, value: Any) -> int:
+    builder.append(str(value))
+    return builder.length
+
+
+def metin_yapici_satir_ekle(builder: MetinYapici, value: Any = "") -> int:
+    builder.append(f"{value}\n")
+    return builder.length
+
+
+def metin_yapici_uzunluk(builder: MetinYapici) -> int:
+    return builder.length
+
+
+def metin_yapici_bitir(builder: MetinYapici) -> str:
+    return builder.finish()
+
+
+def metin_yapici_dosyaya_yaz(builder: MetinYapici, path: str) -> str:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.writelines(builder.parts)
+    return path
+
+
 def arg_getir(index: int, default: str = "") -> str:
     i = int(index)
     if i < 0 or i >= len(sys.argv):
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import atexit
+import dataclasses
+import hashlib
+import multiprocessing
+import os
+import pickle
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+__all__ = ["paralel_esle"]
+
+# Havuz basina is parcasi sayisi: tek bir yavas parca tum isi bekletmesin.
+_PARCA_CARPANI = 4
+
+_pools: Dict[int, Any] = {}
+
+# Isci surecinde son yuklenen program; ayni program icin yorumlayici yeniden kurulmaz.
+_worker_key: Optional[str] = None
+_worker_interp: Any = None
+
+
+def _close_pools() -> None:
+    for pool in _pools.values():
+        pool.terminate()
+    _pools.clear()
+
+
+atexit.register(_close_pools)
+
+
+def _pool(workers: int) -> Any:
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = multiprocessing.Pool(workers)
+        _pools[workers] = pool
+    return pool
+
+
+def _var_names(node: Any, out: Set[str]) -> None:
+    from taylan.core.interpreter import Node, Var
+
+    if isinstance(node, list):
+        for item in node:
+            _var_names(item, out)
+    elif isinstance(node, Var):
+        out.add(node.name)
+    elif isinstance(node, Node):
+        for field in dataclasses.fields(node):
+            _var_names(getattr(node, field.name), out)
+
+
+def _program_payload(interp: Any) -> Tuple[str, bytes]:
+    from taylan.core.interpreter import STDLIB_MODULES
+    from taylan.core.resolver import function_layout
+
+    functions = list(interp.functions.values())
+    # Yalnizca fonksiyonlarin okudugu globaller gonderilir; buyuk girdi dizileri tekrar kopyalanmaz.
+    free: Set[str] = set()
+    for func in functions:
+        names: Set[str] = set()
+        _var_names(func.body, names)
+        free |= names - set(function_layout(func).slots)
+    shipped = {}
+    for name in sorted(free):
+        if name in interp.globals:
+            try:
+                pickle.dumps(interp.globals[name])
+            except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+                raise TypeError(f"paralel_esle: global '{name}' iscilere gonderilemiyor: {e}") from None
+            shipped[name] = interp.globals[name]
+    module_names = {mod: name for name, mod in STDLIB_MODULES.items()}
+    modules = set()
+    for fn in interp.builtins.values():
+        name = module_names.get(getattr(getattr(fn, "func", fn), "__module__", None))
+        if name is not None:
+            modules.add(name)
+    payload = pickle.dumps(
+        (interp.engine, interp.base_dir, sorted(modules), functions, shipped),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    return hashlib.sha1(payload).hexdigest(), payload
+
+
+def _worker_interpreter(key: str, payload: bytes) -> Any:
+    global _worker_key, _worker_interp
+    if _worker_key != key:
+        from taylan.core.interpreter import Interpreter, Program
+
+        engine, base_dir, modules, functions, shipped = pickle.loads(payload)
+        interp = Interpreter(base_dir=base_dir, engine=engine)
+        for name in modules:
+            interp._import_module(name, interp.globals)
+        interp.globals.update(shipped)
+        interp.run_program(Program(functions))
+        _worker_key, _worker_interp = key, interp
+    return _worker_interp
+
+
+def _run_chunk(task: Tuple[str, bytes, str, int, List[Any]]) -> Tuple[bool, int, Any]:
+    key, payload, name, start, items = task
+    interp = _worker_interpreter(key, payload)
+    out = []
+    for offset, item in enumerate(items):
+        try:
+            out.append(interp.call_function(name, [item]))
+        except Exception as e:
+            return False, start + offset, f"{type(e).__name__}: {e}"
+    return True, start, out
+
+
+def _failure(name: str, index: int, item: Any, error: str) -> RuntimeError:
+    return RuntimeError(f"paralel_esle: {index}. eleman ({item!r}) icin {name} hata verdi: {error}")
+
+
+def paralel_esle(interp: Any, fonksiyon_adi: str, dizi: List[Any], isci_sayisi: int = 0) -> List[Any]:
+    name = str(fonksiyon_adi)
+    if name not in interp.functions:
+        raise NameError(f"Bilinmeyen fonksiyon: {name}")
+    if len(interp.functions[name].params) != 1:
+        raise TypeError(f"paralel_esle: {name} tek parametre almali")
+    items = list(dizi)
+    workers = int(isci_sayisi) or os.cpu_count() or 1
+    if not items:
+        return []
+
+    # Tek isci ya da zaten bir havuz iscisinin icindeyken (daemon surec alt surec acamaz) seri calisir.
+    if workers <= 1 or multiprocessing.current_process().daemon:
+        out = []
+        for index, item in enumerate(items):
+            try:
+                out.append(interp.call_function(name, [item]))
+            except Exception as e:
+                raise _failure(name, index, item, f"{type(e).__name__}: {e}") from e
+        return out
+
+    key, payload = _program_payload(interp)
+    size = max(1, -(-len(items) // (workers * _PARCA_CARPANI)))
+    tasks = [(key, payload, name, i, items[i : i + size]) for i in range(0, len(items), size)]
+    out = []
+    for ok, index, value in _pool(workers).imap(_run_chunk, tasks):
+        if not ok:
+            raise _failure(name, index, items[index], value)
+        out.extend(value)
+    return out
+
+
+paralel_esle.taylan_interp = True
@@ -0,0 +1,58 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import parse_source
+from taylan.core.profiler import ProfilingInterpreter
+
+MODUL = """\
+fonksiyon kare(x):
+    don x * x
+bitti
+"""
+
+ANA = """\
+dahil "yardim"
+t = 0
+icin i = 0, 3:
+    t = t + kare(i)
+bitti
+"""
+
+
+class ModulSatirlariTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.mkdtemp()
+        with open(os.path.join(self.dir, "yardim.tay"), "w", encoding="utf-8") as f:
+            f.write(MODUL)
+        self.main = os.path.join(self.dir, "ana.tay")
+        with open(self.main, "w", encoding="utf-8") as f:
+            f.write(ANA)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_modul_satirlari_ayri_sayilir(self) -> None:
+        interp = ProfilingInterpreter(base_dir=self.dir, use_cache=False, path=self.main)
+        interp.run_program(parse_source(ANA))
+        module = os.path.join(self.dir, "yardim.tay")
+        main = os.path.abspath(self.main)
+
+        self.assertEqual(interp.line_stats[(module, 1)].calls, 1)
+        self.assertEqual(interp.line_stats[(module, 2)].calls, 3)
+        self.assertEqual(interp.line_stats[(main, 1)].calls, 1)
+        self.assertEqual(interp.line_stats[(main, 2)].calls, 1)
+        self.assertEqual(interp.line_stats[(main, 4)].calls, 3)
+
+        rows = {r["location"]: r for r in interp.report(ANA.splitlines())["lines"]}
+        self.assertEqual(rows["yardim.tay:2"]["source"], "don x * x")
+        self.assertEqual(rows["ana.tay:2"]["source"], "t = 0")
+        self.assertEqual(rows["yardim.tay:2"]["calls"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import importlib
+import os
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taylan.core.interpreter import Interpreter
+
+tasync = importlib.import_module("taylan_std.async")
+
+PROGRAM = """
+dahil "tasync"
+
+fonksiyon uyu(ms):
+    bekle(ms)
+    don ms
+bitti
+"""
+
+
+class GorevBekleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Tek isci: ikinci gorev birincisi bitene kadar kuyrukta kalir.
+        self._saved = tasync._executor
+        tasync._executor = ThreadPoolExecutor(max_workers=1)
+        self.interp = Interpreter()
+        self.interp.run(PROGRAM)
+
+    def tearDown(self) -> None:
+        tasync._executor.shutdown(wait=True)
+        tasync._executor = self._saved
+
+    def test_kuyruktaki_gorev_zaman_asimina_uyar(self) -> None:
+        start = self.interp.builtins["gorev_baslat"]
+        tasync.gorev_bekle(start("uyu", 1), None)
+        blocker = start("uyu", 400)
+        queued = start("uyu", 1500)
+        t0 = time.perf_counter()
+        with self.assertRaises(TimeoutError):
+            tasync.gorev_bekle(queued, 100)
+        self.assertLess(time.perf_counter() - t0, 0.35)
+        self.assertEqual(tasync.gorev_bekle(blocker), 400)
+
+    def test_zaman_asimisiz_bekleme_kuyruktakini_satir_ici_calistirir(self) -> None:
+        start = self.interp.builtins["gorev_baslat"]
+        blocker = start("uyu", 300)
+        queued = start("uyu", 1)
+        self.assertEqual(tasync.gorev_bekle(queued), 1)
+        self.assertFalse(tasync.gorev_hazir_mi(blocker))
+        self.assertEqual(tasync.hepsini_bekle([blocker]), [300])
+
+
+if __name__ == "__main__":
+    unittest.main()